@@ -14,6 +14,7 @@ from .member_logs import MemberLogs
 from .attachment_logs import AttachmentLogs
 from .admin_commands import LoggingAdmin
 from .voice_logs import VoiceLogs
+from utils.database import flush_log_counters
 from datetime import timedelta
 
 logger = logging.getLogger(__name__)
@@ -69,6 +70,15 @@ class ConfigurableLogging(commands.Cog):
                 await module.teardown()
                 logger.debug(f"Teardown module: {module.__class__.__name__}")
 
+        # Flush logs still waiting in the shared send queue; a reload builds a fresh BaseLogger
+        base = getattr(self.bot, 'logging_base', None)
+        if base is not None:
+            await base.close()
+            del self.bot.logging_base
+
+        # Logs delivered by that flush count toward message statistics after MessageLogs' own final flush
+        await flush_log_counters()
+
     # ==================== EVENT FORWARDING ====================
     # Forward Discord events to appropriate modules
 
@@ -141,6 +151,26 @@ class ConfigurableLogging(commands.Cog):
         """Forward member unban events to member logger"""
         await self.member_logs.on_member_unban(guild, user)
 
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before, after):
+        """Invalidate cached log channel routing when a role changes"""
+        self.invalidate_routing(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        """Invalidate cached log channel routing when channel overwrites change"""
+        if before.overwrites != after.overwrites:
+            self.invalidate_routing(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """Invalidate cached log channel routing when a channel is deleted"""
+        self.invalidate_routing(channel.guild.id)
+
+    def invalidate_routing(self, guild_id):
+        """Drop the shared cached log channel routing for a guild"""
+        self.admin_commands.base.invalidate_guild(guild_id)
+
     # ==================== VOICE EVENT FORWARDING ====================
 
     @commands.Cog.listener()
@@ -159,6 +189,7 @@ class ConfigurableLogging(commands.Cog):
     async def log_config(self, interaction: discord.Interaction, channel: discord.TextChannel = None, enabled: bool = None):
         """Forward to admin commands module"""
         await self.admin_commands.log_config(interaction, channel, enabled)
+        self.invalidate_routing(interaction.guild_id)
 
     @discord.app_commands.command(name="log_events", description="Configure which events to log (Admin only)")
     @discord.app_commands.describe(
@@ -197,11 +228,13 @@ class ConfigurableLogging(commands.Cog):
     async def log_setup_granular(self, interaction: discord.Interaction):
         """Set up granular logging with individual channels for each event"""
         await self.admin_commands.log_setup_granular(interaction)
+        self.invalidate_routing(interaction.guild_id)
 
     @discord.app_commands.command(name="log_setup_grouped", description="📋 Create grouped channels for related events (4-6 channels)")
     async def log_setup_grouped(self, interaction: discord.Interaction):
         """Set up grouped logging with channels for related event types"""
         await self.admin_commands.log_setup_grouped(interaction)
+        self.invalidate_routing(interaction.guild_id)
 
     # ==================== NEW: ADVANCED CONFIGURATION COMMANDS ====================
 
@@ -230,6 +263,7 @@ class ConfigurableLogging(commands.Cog):
     async def log_channel(self, interaction: discord.Interaction, event: str, channel: discord.TextChannel):
         """Map a specific event to a specific channel"""
         await self.admin_commands.log_channel(interaction, event, channel)
+        self.invalidate_routing(interaction.guild_id)
 
     @discord.app_commands.command(name="log_group", description="📋 Map multiple events to one channel")
     @discord.app_commands.describe(
@@ -239,6 +273,7 @@ class ConfigurableLogging(commands.Cog):
     async def log_group(self, interaction: discord.Interaction, events: str, channel: discord.TextChannel):
         """Map multiple events to a single channel"""
         await self.admin_commands.log_group(interaction, events, channel)
+        self.invalidate_routing(interaction.guild_id)
 
     # ==================== NEW: MANAGEMENT COMMANDS ====================
 
@@ -256,6 +291,7 @@ class ConfigurableLogging(commands.Cog):
     async def log_channels_reset(self, interaction: discord.Interaction):
         """Reset all event channel mappings"""
         await self.admin_commands.log_channels_reset(interaction)
+        self.invalidate_routing(interaction.guild_id)
 
     # ==================== VOICE STATISTICS COMMANDS ====================
 
@@ -506,7 +542,7 @@ class ConfigurableLogging(commands.Cog):
         events = []
         for module in self.modules:
             if hasattr(module, 'event_types'):
-                events.extend(module.event_types.keys())
+                events.extend(module.event_types)
         return sorted(list(set(events)))
 
     def get_advanced_features(self) -> Dict[str, bool]:
@@ -7,47 +7,164 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
+import asyncio
 from datetime import datetime
-from typing import Optional, List
+from itertools import islice
+from types import MappingProxyType
+from typing import Final, Optional, List, Mapping, Dict, Tuple
 
 from .base import LoggingModule
 from utils.database import (
     get_guild_config, is_logging_enabled, is_event_enabled,
-    update_guild_config, set_event_enabled, db_manager,
-    set_event_channel, set_events_channel, get_event_channel,
-    get_all_event_channels, get_channel_mapping_summary,
-    clear_all_event_channels, remove_event_channel, get_channel_events
+    update_guild_config, set_event_enabled, set_events_enabled, db_manager,
+    set_event_channel, set_events_channel,
+    get_all_event_channels, cached_mapping_summary,
+    clear_all_event_channels, remove_event_channel, get_channel_events,
+    count_event_channels, cached_guild_config, cached_event_channel,
+    get_all_enabled_events
 )
 from utils.embeds import EmbedBuilder
 from utils.channel_manager import get_channel_manager
 
 logger = logging.getLogger(__name__)
 
+class _EventNames(dict):
+    """Event type -> display name; unknown event types display as themselves"""
+
+    def __missing__(self, key):
+        return key
+
+# Available event types for configuration
+EVENT_TYPES: Mapping[str, str] = MappingProxyType(_EventNames({
+    'message_delete': 'Message Deletions',
+    'message_edit': 'Message Edits',
+    'image_send': 'Image/File Uploads',
+    'image_delete': 'Image/File Deletions',
+    'member_join': 'Member Joins',
+    'member_leave': 'Member Leaves',
+    'member_ban': 'Member Bans',
+    'member_unban': 'Member Unbans',
+    'voice_join': 'Voice Channel Joins',
+    'voice_leave': 'Voice Channel Leaves',
+    'voice_move': 'Voice Channel Moves',
+    'voice_mute': 'Voice Mute/Unmute',
+    'voice_deafen': 'Voice Deafen/Undeafen',
+    'voice_stream': 'Voice Streaming',
+    'voice_video': 'Voice Video/Camera'
+}))
+EVENT_TYPE_KEYS = frozenset(EVENT_TYPES)
+
+# Event types grouped by category
+EVENT_GROUPS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'Message Events': ('message_delete', 'message_edit'),
+    'File Events': ('image_send', 'image_delete'),
+    'Member Events': ('member_join', 'member_leave', 'member_ban', 'member_unban'),
+    'Voice Events': ('voice_join', 'voice_leave', 'voice_move', 'voice_mute', 'voice_deafen', 'voice_stream', 'voice_video')
+})
+
+# Prebuilt (name, value, inline) fields for /log_events_list, which never change at runtime
+_EVENT_GROUP_FIELDS: Tuple[Tuple[str, str, bool], ...] = tuple(
+    (f"{group_name} ({len(events)})", "\n".join(f"• **{e}**: {EVENT_TYPES[e]}" for e in events), False)
+    for group_name, events in EVENT_GROUPS.items()
+)
+_EVENT_STATS_VALUE = (
+    f"**Total Events:** {len(EVENT_TYPES)}\n"
+    f"**Event Groups:** {len(EVENT_GROUPS)}\n"
+    f"**Categories:** Message, File, Member, Voice"
+)
+
+# Permissions the bot needs in a log channel, as (attribute, display name) pairs
+_REQUIRED_CHANNEL_PERMS = (
+    ('send_messages', 'Send Messages'),
+    ('embed_links', 'Embed Links'),
+    ('attach_files', 'Attach Files'),
+    ('read_message_history', 'Read Message History'),
+    ('use_external_emojis', 'Use External Emojis')
+)
+
+# Guild-wide permissions needed for auto-setup and advanced logging
+_REQUIRED_GUILD_PERMS = (
+    ('manage_channels', 'Manage Channels (for auto-setup)'),
+    ('view_audit_log', 'View Audit Log (for advanced logging)')
+)
+
+# Setup summary field templates, filled with format_map
+_GRANULAR_SUMMARY_TMPL = (
+    "**Category:** {category}\n"
+    "**New Channels:** {new}\n"
+    "**Existing Channels:** {existing}\n"
+    "**Events Mapped:** {mapped}\n"
+    "**Total Events:** {total}"
+)
+_GROUPED_SUMMARY_TMPL = (
+    "**Category:** {category}\n"
+    "**New Channels:** {new}\n"
+    "**Existing Channels:** {existing}\n"
+    "**Groups Mapped:** {mapped}\n"
+    "**Total Events:** {total}"
+)
+
+# Status strings indexed by a bool (False -> 0, True -> 1)
+_STATUS_EMOJI = ("🔴", "🟢")
+_STATUS_WORD = ("Disabled", "Enabled")
+_STATUS_TEXT = ("❌ Disabled", "✅ Enabled")
+
+# Static help text shared by the legacy and status commands
+_QUICK_SETUP_VALUE: Final[str] = (
+    "• `/log_setup_granular` - Individual channels per event\n"
+    "• `/log_setup_grouped` - Organized channel groups\n"
+    "• `/log_config` - Basic single-channel setup"
+)
+_ADVANCED_SETUP_VALUE: Final[str] = (
+    "• `/log_setup_granular` - Individual channels per event\n"
+    "• `/log_setup_grouped` - Organized channel groups\n"
+    "• `/log_channels_list` - View current mappings"
+)
+_QUICK_ACTIONS_VALUE: Final[str] = (
+    "• `/log_channels_list` - View detailed mappings\n"
+    "• `/log_channels_test` - Test your configuration\n"
+    "• `/log_setup_granular` - Upgrade to granular logging\n"
+    "• `/log_setup_grouped` - Switch to grouped logging"
+)
+_EVENT_OPTIONS_TAIL: Final[str] = (
+    "• `/log_channels_list` - View all mappings\n"
+    "• `/log_setup_granular` - Full granular setup"
+)
+_USAGE_EXAMPLES_VALUE: Final[str] = (
+    "• `/log_channel event:message_delete channel:#deletions`\n"
+    "• `/log_group events:member_join,member_leave channel:#members`\n"
+    "• `/log_setup_granular` - Creates channels for all events\n"
+    "• `/log_setup_grouped` - Creates grouped channels"
+)
+
+# Static trailing fields for /log_config and /log_status, as (name, value, inline)
+_CONFIG_EXTRA_FIELDS: Tuple[Tuple[str, str, bool], ...] = (
+    ("🚀 Advanced Setup Options", _ADVANCED_SETUP_VALUE, False),
+)
+_STATUS_EXTRA_FIELDS: Tuple[Tuple[str, str, bool], ...] = (
+    ("⚡ Quick Actions", _QUICK_ACTIONS_VALUE, False),
+)
+
 class LoggingAdmin(LoggingModule):
     """Enhanced administrative commands for flexible logging configuration"""
 
+    # Shared read-only mapping, exposed for module status reporting
+    event_types = EVENT_TYPES
+
     def __init__(self, bot):
         super().__init__(bot)
         self.channel_manager = get_channel_manager(bot)
 
-        # Available event types for configuration
-        self.event_types = {
-            'message_delete': 'Message Deletions',
-            'message_edit': 'Message Edits',
-            'image_send': 'Image/File Uploads',
-            'image_delete': 'Image/File Deletions',
-            'member_join': 'Member Joins',
-            'member_leave': 'Member Leaves',
-            'member_ban': 'Member Bans',
-            'member_unban': 'Member Unbans',
-            'voice_join': 'Voice Channel Joins',
-            'voice_leave': 'Voice Channel Leaves',
-            'voice_move': 'Voice Channel Moves',
-            'voice_mute': 'Voice Mute/Unmute',
-            'voice_deafen': 'Voice Deafen/Undeafen',
-            'voice_stream': 'Voice Streaming',
-            'voice_video': 'Voice Video/Camera'
-        }
+        # Template embed for /log_status on unconfigured guilds, copied per use
+        self._status_not_configured_embed = EmbedBuilder.warning(
+            "Logging Not Configured",
+            "❌ Logging has not been configured for this server."
+        )
+        self._status_not_configured_embed.add_field(
+            name="🚀 Quick Setup Options",
+            value=_QUICK_SETUP_VALUE,
+            inline=False
+        )
 
     async def verify_bot_permissions(self, guild: discord.Guild, channel: discord.TextChannel = None) -> dict:
         """Verify bot has required permissions for logging"""
@@ -55,19 +172,7 @@ class LoggingAdmin(LoggingModule):
         if channel:
             # Check specific channel permissions
             perms = channel.permissions_for(guild.me)
-            missing_perms = []
-
-            required_permissions = {
-                'send_messages': 'Send Messages',
-                'embed_links': 'Embed Links',
-                'attach_files': 'Attach Files',
-                'read_message_history': 'Read Message History',
-                'use_external_emojis': 'Use External Emojis'
-            }
-
-            for perm, display_name in required_permissions.items():
-                if not getattr(perms, perm, False):
-                    missing_perms.append(display_name)
+            missing_perms = [name for perm, name in _REQUIRED_CHANNEL_PERMS if not getattr(perms, perm, False)]
 
             return {
                 'valid': len(missing_perms) == 0,
@@ -77,12 +182,7 @@ class LoggingAdmin(LoggingModule):
         else:
             # Check general guild permissions
             perms = guild.me.guild_permissions
-            missing_perms = []
-
-            if not perms.manage_channels:
-                missing_perms.append('Manage Channels (for auto-setup)')
-            if not perms.view_audit_log:
-                missing_perms.append('View Audit Log (for advanced logging)')
+            missing_perms = [name for perm, name in _REQUIRED_GUILD_PERMS if not getattr(perms, perm, False)]
 
             return {
                 'valid': len(missing_perms) == 0,
@@ -106,6 +206,18 @@ class LoggingAdmin(LoggingModule):
 
     async def log_setup_granular(self, interaction: discord.Interaction):
         """Set up granular logging with individual channels for each event"""
+        if not self.check_admin_permissions(interaction.user):
+            await interaction.response.send_message(
+                "❌ You need administrator permissions to configure logging.", ephemeral=True
+            )
+            return
+
+        if not self.check_module_enabled():
+            await interaction.response.send_message(
+                "❌ The logging module is not enabled on this bot.", ephemeral=True
+            )
+            return
+
         await interaction.response.send_message("🔧 Setting up granular logging channels...", ephemeral=True)
 
         try:
@@ -118,18 +230,6 @@ class LoggingAdmin(LoggingModule):
                 )
                 return
 
-            if not self.check_admin_permissions(interaction.user):
-                await interaction.edit_original_response(
-                    content="❌ You need administrator permissions to configure logging."
-                )
-                return
-
-            if not self.check_module_enabled():
-                await interaction.edit_original_response(
-                    content="❌ The logging module is not enabled on this bot."
-                )
-                return
-
             # Set up granular channels
             results = await self.channel_manager.setup_granular_channels(interaction.guild)
 
@@ -139,14 +239,13 @@ class LoggingAdmin(LoggingModule):
                 config = await get_guild_config(guild_id) or {}
                 config['logging_enabled'] = True
                 config['guild_name'] = interaction.guild.name
-                await update_guild_config(guild_id, config)
-
-                # Enable all events
-                for event_type in self.event_types.keys():
-                    await set_event_enabled(guild_id, event_type, True)
 
-                # Send welcome messages
-                await self.channel_manager.send_welcome_messages(results, "granular")
+                # Save config, enable all events and send welcome messages concurrently
+                await asyncio.gather(
+                    update_guild_config(guild_id, config),
+                    set_events_enabled(guild_id, list(EVENT_TYPE_KEYS), True),
+                    self.channel_manager.send_welcome_messages(results, "granular")
+                )
 
                 # Create success embed
                 embed = EmbedBuilder.success(
@@ -156,16 +255,18 @@ class LoggingAdmin(LoggingModule):
 
                 embed.add_field(
                     name="📊 Setup Summary",
-                    value=f"**Category:** {results['category'].name if results['category'] else 'Failed'}\n"
-                          f"**New Channels:** {len(results['channels_created'])}\n"
-                          f"**Existing Channels:** {len(results['channels_existing'])}\n"
-                          f"**Events Mapped:** {len(results['events_mapped'])}\n"
-                          f"**Total Events:** {len(self.event_types)}",
+                    value=_GRANULAR_SUMMARY_TMPL.format_map({
+                        'category': results['category'].name if results['category'] else 'Failed',
+                        'new': len(results['channels_created']),
+                        'existing': len(results['channels_existing']),
+                        'mapped': len(results['events_mapped']),
+                        'total': len(EVENT_TYPES)
+                    }),
                     inline=False
                 )
 
                 if results['channels_created']:
-                    channel_list = [f"• {ch.name}" for ch in results['channels_created'][:10]]
+                    channel_list = [f"• {ch.name}" for ch in islice(results['channels_created'], 10)]
                     if len(results['channels_created']) > 10:
                         channel_list.append(f"... and {len(results['channels_created']) - 10} more")
 
@@ -198,26 +299,26 @@ class LoggingAdmin(LoggingModule):
             await interaction.edit_original_response(content=None, embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in log_setup_granular: {e}")
+            logger.error("Error in log_setup_granular: %s", e)
             await interaction.edit_original_response(content="❌ Error setting up granular logging")
 
     async def log_setup_grouped(self, interaction: discord.Interaction):
         """Set up grouped logging with channels for related event types"""
-        await interaction.response.send_message("🔧 Setting up grouped logging channels...", ephemeral=True)
+        if not self.check_admin_permissions(interaction.user):
+            await interaction.response.send_message(
+                "❌ You need administrator permissions to configure logging.", ephemeral=True
+            )
+            return
 
-        try:
-            if not self.check_admin_permissions(interaction.user):
-                await interaction.edit_original_response(
-                    content="❌ You need administrator permissions to configure logging."
-                )
-                return
+        if not self.check_module_enabled():
+            await interaction.response.send_message(
+                "❌ The logging module is not enabled on this bot.", ephemeral=True
+            )
+            return
 
-            if not self.check_module_enabled():
-                await interaction.edit_original_response(
-                    content="❌ The logging module is not enabled on this bot."
-                )
-                return
+        await interaction.response.send_message("🔧 Setting up grouped logging channels...", ephemeral=True)
 
+        try:
             # Set up grouped channels
             results = await self.channel_manager.setup_grouped_channels(interaction.guild)
 
@@ -227,14 +328,13 @@ class LoggingAdmin(LoggingModule):
                 config = await get_guild_config(guild_id) or {}
                 config['logging_enabled'] = True
                 config['guild_name'] = interaction.guild.name
-                await update_guild_config(guild_id, config)
-
-                # Enable all events
-                for event_type in self.event_types.keys():
-                    await set_event_enabled(guild_id, event_type, True)
 
-                # Send welcome messages
-                await self.channel_manager.send_welcome_messages(results, "grouped")
+                # Save config, enable all events and send welcome messages concurrently
+                await asyncio.gather(
+                    update_guild_config(guild_id, config),
+                    set_events_enabled(guild_id, list(EVENT_TYPE_KEYS), True),
+                    self.channel_manager.send_welcome_messages(results, "grouped")
+                )
 
                 # Create success embed
                 embed = EmbedBuilder.success(
@@ -244,11 +344,13 @@ class LoggingAdmin(LoggingModule):
 
                 embed.add_field(
                     name="📊 Setup Summary",
-                    value=f"**Category:** {results['category'].name if results['category'] else 'Failed'}\n"
-                          f"**New Channels:** {len(results['channels_created'])}\n"
-                          f"**Existing Channels:** {len(results['channels_existing'])}\n"
-                          f"**Groups Mapped:** {len(results['groups_mapped'])}\n"
-                          f"**Total Events:** {sum(g['event_count'] for g in results['groups_mapped'])}",
+                    value=_GROUPED_SUMMARY_TMPL.format_map({
+                        'category': results['category'].name if results['category'] else 'Failed',
+                        'new': len(results['channels_created']),
+                        'existing': len(results['channels_existing']),
+                        'mapped': len(results['groups_mapped']),
+                        'total': sum(g['event_count'] for g in results['groups_mapped'])
+                    }),
                     inline=False
                 )
 
@@ -286,22 +388,22 @@ class LoggingAdmin(LoggingModule):
             await interaction.edit_original_response(content=None, embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in log_setup_grouped: {e}")
+            logger.error("Error in log_setup_grouped: %s", e)
             await interaction.edit_original_response(content="❌ Error setting up grouped logging")
 
     # ==================== MANUAL CONFIGURATION COMMANDS ====================
 
     async def log_channel(self, interaction: discord.Interaction, event: str, channel: discord.TextChannel):
         """Map a specific event to a specific channel"""
+        if not self.check_admin_permissions(interaction.user):
+            await interaction.response.send_message(
+                "❌ You need administrator permissions to configure logging.", ephemeral=True
+            )
+            return
+
         await interaction.response.send_message("⚙️ Configuring event channel mapping...", ephemeral=True)
 
         try:
-            if not self.check_admin_permissions(interaction.user):
-                await interaction.edit_original_response(
-                    content="❌ You need administrator permissions to configure logging."
-                )
-                return
-
             guild_id = str(interaction.guild.id)
 
             # Check if logging is enabled
@@ -311,13 +413,16 @@ class LoggingAdmin(LoggingModule):
                 )
                 return
 
-            # Set the event-channel mapping
-            await set_event_channel(guild_id, event, str(channel.id), channel.name)
-
-            # Enable the event if not already enabled
-            await set_event_enabled(guild_id, event, True)
+            # Set the event-channel mapping, enable the event and fetch the channel's
+            # other events together; the current event is filtered out of the read
+            channel_id = str(channel.id)
+            other_events, _, _ = await asyncio.gather(
+                get_channel_events(guild_id, channel_id),
+                set_event_channel(guild_id, event, channel_id, channel.name),
+                set_event_enabled(guild_id, event, True)
+            )
 
-            event_name = self.event_types.get(event, event)
+            event_name = EVENT_TYPES[event]
 
             embed = EmbedBuilder.success(
                 "🎯 Event Channel Configured",
@@ -329,16 +434,15 @@ class LoggingAdmin(LoggingModule):
                 value=f"**Event:** {event_name}\n"
                       f"**Channel:** {channel.mention}\n"
                       f"**Event Enabled:** ✅ Yes\n"
-                      f"**Channel ID:** `{channel.id}`",
+                      f"**Channel ID:** `{channel_id}`",
                 inline=False
             )
 
             # Show other events in the same channel
-            other_events = await get_channel_events(guild_id, str(channel.id))
             other_events = [e for e in other_events if e != event]
 
             if other_events:
-                other_names = [self.event_types.get(e, e) for e in other_events]
+                other_names = [EVENT_TYPES[e] for e in other_events]
                 embed.add_field(
                     name="🔗 Other Events in This Channel",
                     value="\n".join([f"• {name}" for name in other_names[:5]]),
@@ -356,20 +460,20 @@ class LoggingAdmin(LoggingModule):
             await interaction.edit_original_response(content=None, embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in log_channel: {e}")
+            logger.error("Error in log_channel: %s", e)
             await interaction.edit_original_response(content="❌ Error configuring event channel")
 
     async def log_group(self, interaction: discord.Interaction, events: str, channel: discord.TextChannel):
         """Map multiple events to a single channel"""
+        if not self.check_admin_permissions(interaction.user):
+            await interaction.response.send_message(
+                "❌ You need administrator permissions to configure logging.", ephemeral=True
+            )
+            return
+
         await interaction.response.send_message("⚙️ Configuring event group mapping...", ephemeral=True)
 
         try:
-            if not self.check_admin_permissions(interaction.user):
-                await interaction.edit_original_response(
-                    content="❌ You need administrator permissions to configure logging."
-                )
-                return
-
             guild_id = str(interaction.guild.id)
 
             # Check if logging is enabled
@@ -380,15 +484,9 @@ class LoggingAdmin(LoggingModule):
                 return
 
             # Parse and validate events
-            event_list = [e.strip() for e in events.split(',')]
-            valid_events = []
-            invalid_events = []
-
-            for event in event_list:
-                if event in self.event_types:
-                    valid_events.append(event)
-                else:
-                    invalid_events.append(event)
+            requested = {e.strip() for e in events.split(',')} - {''}
+            valid_events = sorted(requested & EVENT_TYPE_KEYS)
+            invalid_events = sorted(requested - EVENT_TYPE_KEYS)
 
             if not valid_events:
                 await interaction.edit_original_response(
@@ -397,11 +495,11 @@ class LoggingAdmin(LoggingModule):
                 return
 
             # Set the events-channel mapping
-            await set_events_channel(guild_id, valid_events, str(channel.id), channel.name)
+            channel_id = str(channel.id)
+            await set_events_channel(guild_id, valid_events, channel_id, channel.name)
 
             # Enable all events
-            for event in valid_events:
-                await set_event_enabled(guild_id, event, True)
+            await set_events_enabled(guild_id, valid_events, True)
 
             embed = EmbedBuilder.success(
                 "📋 Event Group Configured",
@@ -410,7 +508,7 @@ class LoggingAdmin(LoggingModule):
 
             embed.add_field(
                 name="✅ Mapped Events",
-                value="\n".join([f"• {self.event_types[e]}" for e in valid_events]),
+                value="\n".join([f"• {EVENT_TYPES[e]}" for e in valid_events]),
                 inline=False
             )
 
@@ -426,14 +524,14 @@ class LoggingAdmin(LoggingModule):
                 value=f"**Channel:** {channel.mention}\n"
                       f"**Events Mapped:** {len(valid_events)}\n"
                       f"**All Events Enabled:** ✅ Yes\n"
-                      f"**Channel ID:** `{channel.id}`",
+                      f"**Channel ID:** `{channel_id}`",
                 inline=False
             )
 
             await interaction.edit_original_response(content=None, embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in log_group: {e}")
+            logger.error("Error in log_group: %s", e)
             await interaction.edit_original_response(content="❌ Error configuring event group")
 
     # ==================== STATUS AND MANAGEMENT COMMANDS ====================
@@ -460,7 +558,7 @@ class LoggingAdmin(LoggingModule):
                 return
 
             # Get mapping summary
-            summary = await get_channel_mapping_summary(guild_id)
+            summary = await cached_mapping_summary(guild_id)
 
             embed = discord.Embed(
                 title="📊 Event Channel Mappings",
@@ -473,21 +571,22 @@ class LoggingAdmin(LoggingModule):
                 name="📈 Summary",
                 value=f"**Total Channels:** {summary['total_channels']}\n"
                       f"**Events Mapped:** {summary['total_events_mapped']}\n"
-                      f"**Available Events:** {len(self.event_types)}\n"
+                      f"**Available Events:** {len(EVENT_TYPES)}\n"
                       f"**Logging Status:** ✅ Enabled",
                 inline=False
             )
 
             # Show channel mappings
             if summary['channels']:
-                for channel_info in summary['channels'][:10]:  # Limit to avoid embed size limits
-                    channel = interaction.guild.get_channel(int(channel_info['channel_id']))
+                get_channel = interaction.guild.get_channel
+                for channel_info in islice(summary['channels'], 10):  # Limit to avoid embed size limits
+                    channel = get_channel(channel_info['channel_id_int'])
                     channel_mention = channel.mention if channel else f"#{channel_info['channel_name']}"
 
-                    event_names = [self.event_types.get(e, e) for e in channel_info['events']]
-                    events_text = "\n".join([f"• {name}" for name in event_names[:8]])
-                    if len(event_names) > 8:
-                        events_text += f"\n• ... and {len(event_names) - 8} more"
+                    events = channel_info['events']
+                    events_text = "\n".join([f"• {EVENT_TYPES[e]}" for e in islice(events, 8)])
+                    if len(events) > 8:
+                        events_text += f"\n• ... and {len(events) - 8} more"
 
                     embed.add_field(
                         name=f"📋 {channel_mention} ({channel_info['event_count']} events)",
@@ -503,22 +602,19 @@ class LoggingAdmin(LoggingModule):
                     )
 
             # Show unmapped events
-            all_mapped_events = set()
-            for channel_info in summary['channels']:
-                all_mapped_events.update(channel_info['events'])
+            all_mapped_events = set().union(*(ci['events'] for ci in summary['channels']))
 
-            unmapped_events = set(self.event_types.keys()) - all_mapped_events
+            unmapped_events = EVENT_TYPE_KEYS - all_mapped_events
             if unmapped_events:
-                unmapped_names = [self.event_types[e] for e in unmapped_events]
                 embed.add_field(
                     name="⚠️ Unmapped Events",
-                    value="\n".join([f"• {name}" for name in unmapped_names[:5]]),
+                    value="\n".join([f"• {EVENT_TYPES[e]}" for e in islice(unmapped_events, 5)]),
                     inline=False
                 )
-                if len(unmapped_names) > 5:
+                if len(unmapped_events) > 5:
                     embed.add_field(
                         name="",
-                        value=f"... and {len(unmapped_names) - 5} more unmapped events",
+                        value=f"... and {len(unmapped_events) - 5} more unmapped events",
                         inline=False
                     )
 
@@ -534,22 +630,22 @@ class LoggingAdmin(LoggingModule):
             await interaction.edit_original_response(content=None, embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in log_channels_list: {e}")
+            logger.error("Error in log_channels_list: %s", e)
             await interaction.edit_original_response(content="❌ Error getting channel mappings")
 
     async def log_channels_test(self, interaction: discord.Interaction):
         """Send test messages to verify channel configuration"""
+        if not self.check_admin_permissions(interaction.user):
+            await interaction.response.send_message(
+                "❌ You need administrator permissions to test logging.", ephemeral=True
+            )
+            return
+
         await interaction.response.send_message("🧪 Testing channel configuration...", ephemeral=True)
 
         try:
-            if not self.check_admin_permissions(interaction.user):
-                await interaction.edit_original_response(
-                    content="❌ You need administrator permissions to test logging."
-                )
-                return
-
             guild_id = str(interaction.guild.id)
-            summary = await get_channel_mapping_summary(guild_id)
+            summary = await cached_mapping_summary(guild_id)
 
             if not summary['channels']:
                 await interaction.edit_original_response(
@@ -563,45 +659,31 @@ class LoggingAdmin(LoggingModule):
                 'channels_tested': []
             }
 
-            # Send test message to each configured channel
+            # Send test messages to all configured channels concurrently
+            test_time = int(interaction.created_at.timestamp())
+            targets = []
+            get_channel = interaction.guild.get_channel
             for channel_info in summary['channels']:
-                channel = interaction.guild.get_channel(int(channel_info['channel_id']))
+                channel = get_channel(channel_info['channel_id_int'])
                 if not channel:
                     test_results['failed'] += 1
                     continue
+                targets.append((channel_info, channel))
 
-                try:
-                    test_embed = discord.Embed(
-                        title="🧪 Logging Test Message",
-                        description="This is a test message to verify logging configuration.",
-                        color=discord.Color.green()
-                    )
-
-                    test_embed.add_field(
-                        name="📋 Channel Configuration",
-                        value=f"**Events:** {channel_info['event_count']}\n"
-                              f"**Channel:** {channel.mention}\n"
-                              f"**Test Time:** <t:{int(interaction.created_at.timestamp())}:F>",
-                        inline=False
-                    )
-
-                    mapped_events = [self.event_types.get(e, e) for e in channel_info['events'][:5]]
-                    test_embed.add_field(
-                        name="🎯 Mapped Events",
-                        value="\n".join([f"• {name}" for name in mapped_events]),
-                        inline=False
-                    )
-
-                    test_embed.set_footer(text="Fenrir Logging Test • This message can be safely deleted")
+            send_results = await asyncio.gather(
+                *(channel.send(embed=self.build_test_embed(channel_info, channel, test_time))
+                  for channel_info, channel in targets),
+                return_exceptions=True
+            )
 
-                    await channel.send(embed=test_embed)
+            for (channel_info, channel), result in zip(targets, send_results):
+                if isinstance(result, Exception):
+                    logger.error("Failed to send test message to %s: %s", channel.name, result)
+                    test_results['failed'] += 1
+                else:
                     test_results['success'] += 1
                     test_results['channels_tested'].append(channel.name)
 
-                except Exception as e:
-                    logger.error(f"Failed to send test message to {channel.name}: {e}")
-                    test_results['failed'] += 1
-
             # Report results
             if test_results['success'] > 0:
                 embed = EmbedBuilder.success(
@@ -636,26 +718,24 @@ class LoggingAdmin(LoggingModule):
             await interaction.edit_original_response(content=None, embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in log_channels_test: {e}")
+            logger.error("Error in log_channels_test: %s", e)
             await interaction.edit_original_response(content="❌ Error testing channel configuration")
 
     async def log_channels_reset(self, interaction: discord.Interaction):
         """Reset all event channel mappings"""
+        if not self.check_admin_permissions(interaction.user):
+            await interaction.response.send_message(
+                "❌ You need administrator permissions to reset logging.", ephemeral=True
+            )
+            return
+
         await interaction.response.send_message("⚠️ Resetting channel mappings...", ephemeral=True)
 
         try:
-            if not self.check_admin_permissions(interaction.user):
-                await interaction.edit_original_response(
-                    content="❌ You need administrator permissions to reset logging."
-                )
-                return
-
             guild_id = str(interaction.guild.id)
 
-            # Get current mapping count
-            summary = await get_channel_mapping_summary(guild_id)
-
-            if not summary['channels']:
+            # Nothing to do if no mappings exist
+            if await count_event_channels(guild_id) == 0:
                 await interaction.edit_original_response(
                     content="❌ No channel mappings to reset."
                 )
@@ -687,7 +767,7 @@ class LoggingAdmin(LoggingModule):
             await interaction.edit_original_response(content=None, embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in log_channels_reset: {e}")
+            logger.error("Error in log_channels_reset: %s", e)
             await interaction.edit_original_response(content="❌ Error resetting channel mappings")
 
     # ==================== INFORMATION COMMANDS ====================
@@ -703,41 +783,18 @@ class LoggingAdmin(LoggingModule):
                 color=discord.Color.blue()
             )
 
-            # Group events by category
-            event_groups = {
-                'Message Events': ['message_delete', 'message_edit'],
-                'File Events': ['image_send', 'image_delete'],
-                'Member Events': ['member_join', 'member_leave', 'member_ban', 'member_unban'],
-                'Voice Events': ['voice_join', 'voice_leave', 'voice_move', 'voice_mute', 'voice_deafen', 'voice_stream', 'voice_video']
-            }
-
-            for group_name, events in event_groups.items():
-                event_list = []
-                for event in events:
-                    event_name = self.event_types.get(event, event)
-                    event_list.append(f"• **{event}**: {event_name}")
-
-                embed.add_field(
-                    name=f"{group_name} ({len(events)})",
-                    value="\n".join(event_list),
-                    inline=False
-                )
+            EmbedBuilder.add_fields(embed, _EVENT_GROUP_FIELDS)
 
             # Add usage examples
             embed.add_field(
                 name="💡 Usage Examples",
-                value="• `/log_channel event:message_delete channel:#deletions`\n"
-                      "• `/log_group events:member_join,member_leave channel:#members`\n"
-                      "• `/log_setup_granular` - Creates channels for all events\n"
-                      "• `/log_setup_grouped` - Creates grouped channels",
+                value=_USAGE_EXAMPLES_VALUE,
                 inline=False
             )
 
             embed.add_field(
                 name="📊 Statistics",
-                value=f"**Total Events:** {len(self.event_types)}\n"
-                      f"**Event Groups:** {len(event_groups)}\n"
-                      f"**Categories:** Message, File, Member, Voice",
+                value=_EVENT_STATS_VALUE,
                 inline=False
             )
 
@@ -746,7 +803,7 @@ class LoggingAdmin(LoggingModule):
             await interaction.edit_original_response(content=None, embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in log_events_list: {e}")
+            logger.error("Error in log_events_list: %s", e)
             await interaction.edit_original_response(content="❌ Error loading event types")
 
     # ==================== LEGACY SUPPORT COMMANDS ====================
@@ -755,43 +812,57 @@ class LoggingAdmin(LoggingModule):
                         channel: Optional[discord.TextChannel] = None,
                         enabled: Optional[bool] = None):
         """Configure basic logging settings (legacy support)"""
-        await interaction.response.send_message("⚙️ Configuring basic logging settings...", ephemeral=True)
+        if not self.check_admin_permissions(interaction.user):
+            await interaction.response.send_message(
+                "❌ You need administrator permissions to configure logging.", ephemeral=True
+            )
+            return
 
-        try:
-            if not self.check_admin_permissions(interaction.user):
-                await interaction.edit_original_response(
-                    content="❌ You need administrator permissions to configure logging."
-                )
-                return
+        if not self.check_module_enabled():
+            await interaction.response.send_message(
+                "❌ The logging module is not enabled on this bot.", ephemeral=True
+            )
+            return
 
-            if not self.check_module_enabled():
-                await interaction.edit_original_response(
-                    content="❌ The logging module is not enabled on this bot."
-                )
-                return
+        await interaction.response.send_message("⚙️ Configuring basic logging settings...", ephemeral=True)
 
+        try:
             guild_id = str(interaction.guild.id)
-            config = await get_guild_config(guild_id) or {}
+            current = await cached_guild_config(guild_id) or {}
 
-            # Update configuration
+            # Collect only the changed settings
+            updates = {}
+            if current.get('guild_name') != interaction.guild.name:
+                updates['guild_name'] = interaction.guild.name
             if channel is not None:
-                config['log_channel_id'] = str(channel.id)
+                updates['log_channel_id'] = channel.id
             if enabled is not None:
-                config['logging_enabled'] = enabled
+                updates['logging_enabled'] = enabled
 
-            config['guild_name'] = interaction.guild.name
+            if updates:
+                # Save to database before reporting success
+                await update_guild_config(guild_id, updates, partial=True)
 
-            # Save to database
-            await update_guild_config(guild_id, config)
+                # Overlay the updates on a copy so the cached config is never mutated
+                config = {**current, **updates}
 
-            embed = EmbedBuilder.success(
-                "⚙️ Basic Logging Configuration Updated",
-                "Your basic logging settings have been saved."
-            )
+                embed = EmbedBuilder.success(
+                    "⚙️ Basic Logging Configuration Updated",
+                    "Your basic logging settings have been saved."
+                )
+            else:
+                # Nothing to change, just show the current settings
+                config = current
+
+                embed = EmbedBuilder.info(
+                    "⚙️ Basic Logging Configuration",
+                    "Your current basic logging settings."
+                )
 
             # Show current configuration
-            if config.get('log_channel_id'):
-                log_channel = interaction.guild.get_channel(int(config['log_channel_id']))
+            log_channel_id = config.get('log_channel_id')
+            if log_channel_id:
+                log_channel = channel if channel is not None else interaction.guild.get_channel(log_channel_id)
                 embed.add_field(
                     name="📍 Default Log Channel",
                     value=log_channel.mention if log_channel else "Channel not found",
@@ -806,40 +877,38 @@ class LoggingAdmin(LoggingModule):
 
             embed.add_field(
                 name="🔄 Logging Status",
-                value="✅ Enabled" if config.get('logging_enabled', False) else "❌ Disabled",
+                value=_STATUS_TEXT[bool(config.get('logging_enabled', False))],
                 inline=True
             )
 
             # Advanced setup recommendations
-            embed.add_field(
-                name="🚀 Advanced Setup Options",
-                value="• `/log_setup_granular` - Individual channels per event\n"
-                      "• `/log_setup_grouped` - Organized channel groups\n"
-                      "• `/log_channels_list` - View current mappings",
-                inline=False
-            )
+            EmbedBuilder.add_fields(embed, _CONFIG_EXTRA_FIELDS)
 
             await interaction.edit_original_response(content=None, embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in log_config: {e}")
+            logger.error("Error in log_config: %s", e)
             await interaction.edit_original_response(content="❌ Error configuring basic logging")
 
     async def log_events(self, interaction: discord.Interaction, event: str, enabled: bool):
         """Configure which events to log (legacy support)"""
+        if not self.check_admin_permissions(interaction.user):
+            await interaction.response.send_message(
+                "❌ You need administrator permissions to configure logging.", ephemeral=True
+            )
+            return
+
         await interaction.response.send_message("⚙️ Configuring event logging...", ephemeral=True)
 
         try:
-            if not self.check_admin_permissions(interaction.user):
-                await interaction.edit_original_response(
-                    content="❌ You need administrator permissions to configure logging."
-                )
-                return
-
             guild_id = str(interaction.guild.id)
 
             # Check if logging is enabled
-            if not await is_logging_enabled(guild_id):
+            config, event_channel_id = await asyncio.gather(
+                cached_guild_config(guild_id),
+                cached_event_channel(guild_id, event)
+            )
+            if not config or not config.get('logging_enabled', False):
                 await interaction.edit_original_response(
                     content="❌ Please use `/log_config` to enable logging first!"
                 )
@@ -848,7 +917,7 @@ class LoggingAdmin(LoggingModule):
             # Update event configuration
             await set_event_enabled(guild_id, event, enabled)
 
-            event_name = self.event_types.get(event, event)
+            event_name = EVENT_TYPES[event]
             action = "enabled" if enabled else "disabled"
 
             embed = EmbedBuilder.success(
@@ -857,7 +926,6 @@ class LoggingAdmin(LoggingModule):
             )
 
             # Check if event has a specific channel mapping
-            event_channel_id = await get_event_channel(guild_id, event)
             if event_channel_id:
                 event_channel = interaction.guild.get_channel(int(event_channel_id))
                 embed.add_field(
@@ -865,28 +933,24 @@ class LoggingAdmin(LoggingModule):
                     value=event_channel.mention if event_channel else "Channel not found",
                     inline=True
                 )
-            else:
-                config = await get_guild_config(guild_id)
-                if config and config.get('log_channel_id'):
-                    default_channel = interaction.guild.get_channel(int(config['log_channel_id']))
-                    embed.add_field(
-                        name="📍 Default Channel",
-                        value=default_channel.mention if default_channel else "Channel not found",
-                        inline=True
-                    )
+            elif config.get('log_channel_id'):
+                default_channel = interaction.guild.get_channel(config['log_channel_id'])
+                embed.add_field(
+                    name="📍 Default Channel",
+                    value=default_channel.mention if default_channel else "Channel not found",
+                    inline=True
+                )
 
             embed.add_field(
                 name="🔧 Advanced Options",
-                value=f"• `/log_channel event:{event}` - Set specific channel\n"
-                      "• `/log_channels_list` - View all mappings\n"
-                      "• `/log_setup_granular` - Full granular setup",
+                value=f"• `/log_channel event:{event}` - Set specific channel\n{_EVENT_OPTIONS_TAIL}",
                 inline=False
             )
 
             await interaction.edit_original_response(content=None, embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in log_events: {e}")
+            logger.error("Error in log_events: %s", e)
             await interaction.edit_original_response(content="❌ Error configuring event logging")
 
     async def log_status(self, interaction: discord.Interaction):
@@ -895,41 +959,37 @@ class LoggingAdmin(LoggingModule):
 
         try:
             guild_id = str(interaction.guild.id)
-            config = await get_guild_config(guild_id)
+            config, summary, enabled_events = await asyncio.gather(
+                cached_guild_config(guild_id),
+                cached_mapping_summary(guild_id),
+                get_all_enabled_events(guild_id)
+            )
 
             if not config:
-                embed = EmbedBuilder.warning(
-                    "Logging Not Configured",
-                    "❌ Logging has not been configured for this server."
-                )
-                embed.add_field(
-                    name="🚀 Quick Setup Options",
-                    value="• `/log_setup_granular` - Individual channels per event\n"
-                          "• `/log_setup_grouped` - Organized channel groups\n"
-                          "• `/log_config` - Basic single-channel setup",
-                    inline=False
-                )
+                embed = self._status_not_configured_embed.copy()
                 await interaction.edit_original_response(content=None, embed=embed)
                 return
 
+            enabled = bool(config.get('logging_enabled', False))
+
             # Create comprehensive status embed
             embed = discord.Embed(
                 title="📊 Comprehensive Logging Status",
                 description="Complete logging configuration for this server",
-                color=discord.Color.blue() if config.get('logging_enabled', False) else discord.Color.red()
+                color=discord.Color.blue() if enabled else discord.Color.red()
             )
 
             # Basic configuration
-            status_emoji = "🟢" if config.get('logging_enabled', False) else "🔴"
             embed.add_field(
                 name="🔄 Logging Status",
-                value=f"{status_emoji} {'Enabled' if config.get('logging_enabled', False) else 'Disabled'}",
+                value=f"{_STATUS_EMOJI[enabled]} {_STATUS_WORD[enabled]}",
                 inline=True
             )
 
             # Default log channel
-            if config.get('log_channel_id'):
-                log_channel = interaction.guild.get_channel(int(config['log_channel_id']))
+            log_channel_id = config.get('log_channel_id')
+            if log_channel_id:
+                log_channel = interaction.guild.get_channel(log_channel_id)
                 channel_text = log_channel.mention if log_channel else "⚠️ Channel not found"
             else:
                 channel_text = "❌ Not set"
@@ -941,30 +1001,31 @@ class LoggingAdmin(LoggingModule):
             )
 
             # Channel mapping summary
-            summary = await get_channel_mapping_summary(guild_id)
+            total_channels = summary['total_channels']
+            total_events_mapped = summary['total_events_mapped']
+            setup_type = "Granular" if total_channels > 8 else ("Grouped" if total_channels > 1 else "Basic")
             embed.add_field(
                 name="🎯 Event Channels",
-                value=f"**Mapped Channels:** {summary['total_channels']}\n"
-                      f"**Mapped Events:** {summary['total_events_mapped']}\n"
-                      f"**Setup Type:** {'Granular' if summary['total_channels'] > 8 else 'Grouped' if summary['total_channels'] > 1 else 'Basic'}",
+                value=f"**Mapped Channels:** {total_channels}\n"
+                      f"**Mapped Events:** {total_events_mapped}\n"
+                      f"**Setup Type:** {setup_type}",
                 inline=True
             )
 
             # Module status
             embed.add_field(
                 name="🔧 Module Status",
-                value=f"✅ Enabled" if self.check_module_enabled() else "❌ Disabled",
+                value=_STATUS_TEXT[bool(self.check_module_enabled())],
                 inline=True
             )
 
             # Show enabled events if logging is on
-            if config.get('logging_enabled', False) and db_manager:
-                enabled_events = await db_manager.get_all_enabled_events(guild_id)
+            if enabled and db_manager:
                 if enabled_events:
-                    event_names = [self.event_types.get(event, event) for event in enabled_events[:8]]
-                    events_text = "\n".join([f"✅ {name}" for name in event_names])
-                    if len(enabled_events) > 8:
-                        events_text += f"\n... and {len(enabled_events) - 8} more"
+                    events_text = "\n".join(f"✅ {EVENT_TYPES[event]}" for event in islice(enabled_events, 8))
+                    extra = len(enabled_events) - 8
+                    if extra > 0:
+                        events_text += f"\n... and {extra} more"
 
                     embed.add_field(
                         name="📝 Enabled Events",
@@ -979,23 +1040,42 @@ class LoggingAdmin(LoggingModule):
                     )
 
             # Quick actions
-            embed.add_field(
-                name="⚡ Quick Actions",
-                value="• `/log_channels_list` - View detailed mappings\n"
-                      "• `/log_channels_test` - Test your configuration\n"
-                      "• `/log_setup_granular` - Upgrade to granular logging\n"
-                      "• `/log_setup_grouped` - Switch to grouped logging",
-                inline=False
-            )
+            EmbedBuilder.add_fields(embed, _STATUS_EXTRA_FIELDS)
 
             await interaction.edit_original_response(content=None, embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in log_status: {e}")
+            logger.error("Error in log_status: %s", e)
             await interaction.edit_original_response(content="❌ Error getting logging status")
 
     # ==================== UTILITY METHODS ====================
 
+    def build_test_embed(self, channel_info: dict, channel: discord.TextChannel, test_time: int) -> discord.Embed:
+        """Build the test message embed for a configured log channel"""
+        test_embed = discord.Embed(
+            title="🧪 Logging Test Message",
+            description="This is a test message to verify logging configuration.",
+            color=discord.Color.green()
+        )
+
+        test_embed.add_field(
+            name="📋 Channel Configuration",
+            value=f"**Events:** {channel_info['event_count']}\n"
+                  f"**Channel:** {channel.mention}\n"
+                  f"**Test Time:** <t:{test_time}:F>",
+            inline=False
+        )
+
+        mapped_events = [EVENT_TYPES[e] for e in channel_info['events'][:5]]
+        test_embed.add_field(
+            name="🎯 Mapped Events",
+            value="\n".join([f"• {name}" for name in mapped_events]),
+            inline=False
+        )
+
+        test_embed.set_footer(text="Fenrir Logging Test • This message can be safely deleted")
+        return test_embed
+
     async def get_routing_debug_info(self, guild_id: str) -> str:
         """Get formatted routing debug information"""
         routing_info = await self.base.get_routing_info(guild_id)
@@ -1008,11 +1088,12 @@ class LoggingAdmin(LoggingModule):
             f"🔄 Has Fallback: {'✅' if routing_info.get('has_fallback') else '❌'}"
         ]
 
-        if routing_info.get('event_mappings'):
+        event_mappings = routing_info.get('event_mappings')
+        if event_mappings:
+            mapping_count = len(event_mappings)
             debug_lines.append("\n📋 **Event Mappings:**")
-            for event, channel_id in list(routing_info['event_mappings'].items())[:8]:
-                debug_lines.append(f"  • {event} → {channel_id}")
-            if len(routing_info['event_mappings']) > 8:
-                debug_lines.append(f"  • ... and {len(routing_info['event_mappings']) - 8} more")
+            debug_lines.extend(f"  • {event} → {channel_id}" for event, channel_id in islice(event_mappings.items(), 8))
+            if mapping_count > 8:
+                debug_lines.append(f"  • ... and {mapping_count - 8} more")
 
         return "\n".join(debug_lines)
\ No newline at end of file
@@ -5,14 +5,129 @@ Handles file/image upload and deletion logging with enhanced URL preservation
 
 import discord
 from discord.ext import commands
+import aiohttp
+import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import List, NamedTuple, Optional
 
-from .base import LoggingModule
+from .base import LoggingModule, _MAX_EMBEDS, _MAX_MESSAGE_CHARS
+from utils.database import cached_guild_config
 from utils.bot_logger import log_message, log_event, log_error
 
 logger = logging.getLogger(__name__)
 
+_KB = 1024
+_MB = 1048576
+
+# Discord's limit on characters per field value; per-message limits come from .base
+_FIELD_LIMIT = 1024
+
+# Attachments listed individually in a log embed
+_MAX_LISTED = 10
+
+# Fixed lines of the deletion "Technical Information" field
+_CDN_BEHAVIOR_NOTE = (
+    "• URLs become HTTP 404 immediately upon message deletion\n"
+    "• Files are removed from Discord's CDN permanently\n"
+    "• Only metadata (filename, size, type) is preserved\n"
+)
+
+_PLURAL_SUFFIX = ('', 's')
+
+_COLOR_BLUE = discord.Color.blue()
+_COLOR_RED = discord.Color.red()
+
+# Title templates indexed by bool(images) + 2 * bool(other_files):
+# files only (also the empty fallback), images only, files only, both
+_UPLOAD_TITLES = (
+    "📎 File{sf} Uploaded ({files} file{sf})",
+    "🖼️ Image{si} Uploaded ({images} image{si})",
+    "📎 File{sf} Uploaded ({files} file{sf})",
+    "📎 Files & Images Uploaded ({total} total)"
+)
+_DELETE_TITLES = (
+    "🗑️ File{sf} Deleted ({files} file{sf})",
+    "🗑️ Image{si} Deleted ({images} image{si})",
+    "🗑️ File{sf} Deleted ({files} file{sf})",
+    "🗑️ Files & Images Deleted ({total} total)"
+)
+
+
+def _embed_value(value: str, limit: int = _FIELD_LIMIT) -> str:
+    """Clip an embed field value to Discord's length limit"""
+    return value if len(value) <= limit else value[:limit - 3] + "..."
+
+
+def _join_capped(lines: list, sep: str = "\n", limit: int = _FIELD_LIMIT - 24) -> str:
+    """Join whole lines up to the field limit, marking any that were left out"""
+    kept = []
+    used = 0
+    for line in lines:
+        used += len(line) + len(sep)
+        if used > limit:
+            kept.append("... (truncated)")
+            break
+        kept.append(line)
+    return sep.join(kept)
+
+
+def _split_by_size(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    """Split embeds, in order, into message-sized runs under Discord's combined length limit"""
+    messages: List[List[discord.Embed]] = [[]]
+    chars = 0
+    for embed in embeds:
+        size = len(embed)
+        if messages[-1] and chars + size > _MAX_MESSAGE_CHARS:
+            messages.append([])
+            chars = 0
+        messages[-1].append(embed)
+        chars += size
+    return messages
+
+
+def _plural(count: int) -> str:
+    """Plural suffix for a count ('' for 0 or 1, matching the original titles)"""
+    return _PLURAL_SUFFIX[count > 1]
+
+
+def _pick_title(templates: tuple, images: list, other_files: list) -> str:
+    """Pick and fill the title template for a mix of images and other files"""
+    n_images = len(images)
+    n_files = len(other_files)
+    return templates[bool(n_images) + 2 * bool(n_files)].format(
+        images=n_images, files=n_files, total=n_images + n_files,
+        si=_plural(n_images), sf=_plural(n_files)
+    )
+
+
+class LiveUrl(NamedTuple):
+    """Attachment URL captured when a message is sent"""
+    filename: str
+    url: str
+    id: int
+    size: int
+    captured_at: str
+
+
+class PreservedAttachment(NamedTuple):
+    """Attachment metadata preserved before a deleted message's URLs expire"""
+    filename: str
+    size: int
+    url: str
+    proxy_url: str
+    id: int
+    content_type: Optional[str]
+    width: Optional[int]
+    height: Optional[int]
+    is_spoiler: bool
+    preserved_at: str
+
+
+def _fmt_size(size: int) -> str:
+    """Format a byte count as KB below 1 MB, otherwise as MB"""
+    return f"{size / _KB:.1f} KB" if size < _MB else f"{size / _MB:.1f} MB"
+
 
 class AttachmentLogs(LoggingModule):
     """Handles attachment-related logging events"""
@@ -26,6 +141,10 @@ class AttachmentLogs(LoggingModule):
             'image_delete': 'Image/File Deletions'
         }
 
+        # HTTP session for touching deleted attachment URLs, opened in setup()
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._ping_tasks = set()
+
         # Import enhanced attachment logging if available
         try:
             from utils.enhanced_attachment_logging import (
@@ -44,8 +163,47 @@ class AttachmentLogs(LoggingModule):
 
     async def setup(self):
         """Setup method called when module is loaded"""
+        self._http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=2))
         logger.info("Attachment logging module initialized")
 
+    async def teardown(self):
+        """Teardown method called when module is unloaded"""
+        tasks = list(self._ping_tasks)
+        for task in tasks:
+            task.cancel()
+        # Let the cancelled pings unwind before their session is closed
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._http:
+            await self._http.close()
+            self._http = None
+
+    async def _head(self, url: str) -> int:
+        async with self._http.head(url) as response:
+            return response.status
+
+    async def _ping_urls(self, urls: List[str]):
+        """Touch attachment URLs on the CDN so they stay cached a little longer (best effort)"""
+        results = await asyncio.gather(*(self._head(url) for url in urls), return_exceptions=True)
+        logger.debug("Pinged %s deleted attachment URL(s): %s", len(urls), results)
+
+    def _enhanced_log(self, message, action: str):
+        """Run enhanced attachment logging for an upload or delete
+
+        Call only after the check_logging_enabled gate: it writes the attachment log file on every call.
+        """
+        if not self.enhanced_logging:
+            return
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                self.debug_attachments(message, action)
+            if action == "upload":
+                self.enhanced_send_logging(message)
+            else:
+                self.enhanced_delete_logging(message)
+        except Exception as e:
+            logger.warning(f"Enhanced attachment logging failed: {e}")
+
     async def on_message(self, message):
         """Log messages with attachments/images - ENHANCED with URL preservation"""
         # Skip bot messages
@@ -60,54 +218,99 @@ class AttachmentLogs(LoggingModule):
         if not message.attachments:
             return
 
-        # Enhanced attachment logging if available
-        if self.enhanced_logging:
-            try:
-                self.debug_attachments(message, "upload")
-                preserved_data = self.enhanced_send_logging(message)
-            except Exception as e:
-                logger.warning(f"Enhanced attachment logging failed: {e}")
-
-        logger.info(f"📤 Message with {len(message.attachments)} attachments uploaded")
-        logger.info(f"   Message ID: {message.id}")
-        logger.info(f"   Author: {message.author} ({message.author.id})")
-
-        # Log all attachment URLs for monitoring
-        for i, attachment in enumerate(message.attachments):
-            logger.info(f"   📎 Attachment {i + 1}: {attachment.filename}")
-            logger.info(f"      🔗 Live URL: {attachment.url}")
-            logger.info(f"      📏 Size: {attachment.size} bytes")
-            logger.info(f"      🆔 ID: {attachment.id}")
-
         guild_id = str(message.guild.id)
+        message_id = str(message.id)
+        author = message.author
 
         # Check if logging is enabled for this event
         if not await self.base.check_logging_enabled(guild_id, 'image_send'):
             return
 
+        # Enhanced attachment logging if available
+        self._enhanced_log(message, "upload")
+
         logger.info(f"📤 Processing file upload in {message.guild.name}")
 
-        # Separate images from other files
-        images = [att for att in message.attachments if self.base.is_image_file(att.filename)]
-        other_files = [att for att in message.attachments if not self.base.is_image_file(att.filename)]
+        # One pass over every attachment: classify them, total their size and
+        # capture their live URLs; the display listing below covers the first few
+        atts = message.attachments
+        n_total = len(atts)
+        log_urls = logger.isEnabledFor(logging.INFO)
+        images = []
+        other_files = []
+        attachments_info = []
+        image_links = []
+        live_urls = []
+        img_flags = []
+        captured_at = datetime.now(timezone.utc).isoformat()
+        url_log_lines = [
+            f"📤 Message with {n_total} attachments uploaded",
+            f"   Message ID: {message_id}",
+            f"   Author: {author} ({author.id})"
+        ]
+        total_size = 0
+        is_image_file = self.base.is_image_file
+
+        for i, attachment in enumerate(atts):
+            filename = attachment.filename
+            url = attachment.url
+            att_id = attachment.id
+            size = attachment.size
+
+            is_img = is_image_file(filename)
+            img_flags.append(is_img)
+            if is_img:
+                images.append(attachment)
+            else:
+                other_files.append(attachment)
+            total_size += size
+
+            # Store live URL data
+            live_urls.append(LiveUrl(filename, url, att_id, size, captured_at))
+            if log_urls:
+                url_log_lines.append(f"   📎 Attachment {i + 1}: {filename}")
+                url_log_lines.append(f"      🔗 Live URL: {url}")
+                url_log_lines.append(f"      📏 Size: {size} bytes")
+                url_log_lines.append(f"      🆔 ID: {att_id}")
+
+        # List only the first attachments to avoid embed limits
+        for live, attachment, is_img in zip(live_urls[:_MAX_LISTED], atts, img_flags):
+            emoji = self.base.get_file_type_emoji(live.filename)
+
+            # Enhanced attachment info with technical details
+            content_type = getattr(attachment, 'content_type', None) or 'Unknown'
+            width = getattr(attachment, 'width', None)
+            dimensions = f" • {width}x{attachment.height}" if width else ""
+
+            # Add to main list with enhanced info
+            attachments_info.append(f"{emoji} **{live.filename}** ({_fmt_size(live.size)} • {content_type}{dimensions})")
+
+            # If it's an image, add to clickable links
+            if is_img:
+                image_links.append(f"[{live.filename}]({live.url})")
+
+        if n_total > _MAX_LISTED:
+            attachments_info.append(f"... and {n_total - _MAX_LISTED} more files")
+
+        total_mb = total_size / _MB
+        created_ts = int(message.created_at.timestamp())
+
+        # Log all attachment URLs for monitoring, as one record per message
+        if log_urls:
+            logger.info("\n".join(url_log_lines))
 
         # Determine title based on content
-        if images and other_files:
-            title = f"📎 Files & Images Uploaded ({len(message.attachments)} total)"
-        elif images:
-            title = f"🖼️ Image{'s' if len(images) > 1 else ''} Uploaded ({len(images)} image{'s' if len(images) > 1 else ''})"
-        else:
-            title = f"📎 File{'s' if len(other_files) > 1 else ''} Uploaded ({len(other_files)} file{'s' if len(other_files) > 1 else ''})"
+        title = _pick_title(_UPLOAD_TITLES, images, other_files)
 
         # Create main embed
-        embed = discord.Embed(title=title, color=discord.Color.blue())
+        embed = discord.Embed(title=title, color=_COLOR_BLUE)
 
         # Add user information
-        self.base.add_user_info(embed, message.author, "Author")
+        self.base.add_user_info(embed, author, "Author")
 
         # Add channel and message info
         embed.add_field(name="Channel", value=message.channel.mention, inline=True)
-        embed.add_field(name="Message ID", value=str(message.id), inline=True)
+        embed.add_field(name="Message ID", value=message_id, inline=True)
 
         # Add message content if any
         if message.content:
@@ -118,48 +321,10 @@ class AttachmentLogs(LoggingModule):
         if images:
             embed.set_image(url=images[0].url)
 
-        # Process ALL attachments for listing with enhanced metadata
-        attachments_info = []
-        image_links = []
-        live_urls = []
-        total_size = 0
-
-        for i, attachment in enumerate(message.attachments):
-            emoji = self.base.get_file_type_emoji(attachment.filename)
-            file_size = f"{attachment.size / 1024:.1f} KB" if attachment.size < 1024 * 1024 else f"{attachment.size / (1024 * 1024):.1f} MB"
-            total_size += attachment.size
-
-            # Enhanced attachment info with technical details
-            content_type = getattr(attachment, 'content_type', 'Unknown')
-            dimensions = ""
-            if hasattr(attachment, 'width') and attachment.width:
-                dimensions = f" • {attachment.width}x{attachment.height}"
-
-            # Add to main list with enhanced info
-            attachments_info.append(f"{emoji} **{attachment.filename}** ({file_size} • {content_type}{dimensions})")
-
-            # Store live URL data
-            live_urls.append({
-                'filename': attachment.filename,
-                'url': attachment.url,
-                'id': attachment.id,
-                'size': attachment.size,
-                'captured_at': datetime.utcnow().isoformat()
-            })
-
-            # If it's an image, add to clickable links
-            if self.base.is_image_file(attachment.filename):
-                image_links.append(f"[{attachment.filename}]({attachment.url})")
-
-            # Limit display to avoid embed limits
-            if i >= 9:
-                attachments_info.append(f"... and {len(message.attachments) - 10} more files")
-                break
-
         # Add enhanced attachments list
         embed.add_field(
-            name=f"📎 All Files ({len(message.attachments)}) - Total: {total_size / (1024 * 1024):.2f} MB",
-            value="\n".join(attachments_info),
+            name=f"📎 All Files ({n_total}) - Total: {total_mb:.2f} MB",
+            value=_join_capped(attachments_info),
             inline=False
         )
 
@@ -167,7 +332,7 @@ class AttachmentLogs(LoggingModule):
         if len(images) > 1:
             embed.add_field(
                 name=f"🖼️ View All Images ({len(images)})",
-                value=" • ".join(image_links),
+                value=_join_capped(image_links, " • "),
                 inline=False
             )
 
@@ -175,11 +340,11 @@ class AttachmentLogs(LoggingModule):
         if len(live_urls) <= 3:  # Only show for small numbers
             url_info = []
             for url_data in live_urls:
-                url_info.append(f"• [{url_data['filename']}]({url_data['url']}) (ID: {url_data['id']})")
+                url_info.append(f"• [{url_data.filename}]({url_data.url}) (ID: {url_data.id})")
 
             embed.add_field(
                 name="🔗 Live URLs (Accessible)",
-                value="\n".join(url_info),
+                value=_join_capped(url_info),
                 inline=False
             )
 
@@ -188,9 +353,9 @@ class AttachmentLogs(LoggingModule):
             name="📊 Upload Metadata",
             value=f"**Images:** {len(images)} files\n"
                   f"**Other Files:** {len(other_files)} files\n"
-                  f"**Total Size:** {total_size / (1024 * 1024):.2f} MB\n"
-                  f"**Uploaded:** <t:{int(message.created_at.timestamp())}:F>\n"
-                  f"**URLs Captured:** {len(live_urls)}/{len(message.attachments)}",
+                  f"**Total Size:** {total_mb:.2f} MB\n"
+                  f"**Uploaded:** <t:{created_ts}:F>\n"
+                  f"**URLs Captured:** {len(live_urls)}/{n_total}",
             inline=True
         )
 
@@ -198,20 +363,21 @@ class AttachmentLogs(LoggingModule):
         self.base.create_jump_link_field(embed, message)
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, message.author, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, author, config)
 
-        # Log live URLs for monitoring/debugging
-        logger.info(f"📊 CAPTURED LIVE URLS for message {message.id}:")
-        for url_data in live_urls:
-            logger.info(f"   📎 {url_data['filename']}: {url_data['url']}")
-
-        # Send main embed
-        await self.base.send_log(message.guild, 'image_send', embed)
-
-        # If there are multiple images (more than 3), send additional embeds
+        # Send the main embed with continuation embeds for the other images when there are
+        # multiple images (more than 3); a message holds at most 10 attachments, so 9 continuations
+        embeds = [embed]
         if len(images) > 3:
-            await self.send_multiple_image_logs(message, message.attachments, guild_id)
+            embeds.extend(
+                self.build_image_embed(attachment, i, len(images))
+                for i, attachment in enumerate(images[1:_MAX_EMBEDS], 2)
+            )
+
+        # Long links and metadata can exceed the message length limit, so split across messages if needed
+        for chunk in _split_by_size(embeds):
+            await self.base.send_log_multi(message.guild, 'image_send', chunk)
 
     async def on_message_delete(self, message):
         """Log message deletions with attachments - ENHANCED with URL preservation"""
@@ -227,106 +393,105 @@ class AttachmentLogs(LoggingModule):
         if not message.attachments:
             return
 
-        # Enhanced attachment logging if available
-        if self.enhanced_logging:
-            try:
-                self.debug_attachments(message, "delete")
-                preserved_data = self.enhanced_delete_logging(message)
-            except Exception as e:
-                logger.warning(f"Enhanced attachment logging failed: {e}")
-
         guild_id = str(message.guild.id)
+        message_id = str(message.id)
+        author = message.author
 
         # Check if logging is enabled for this event
         if not await self.base.check_logging_enabled(guild_id, 'image_delete'):
             return
 
-        logger.info(f"🗑️ Processing deletion of message with {len(message.attachments)} attachments")
+        # Ping the CDN URLs in the background while the log embed is built
+        if self._http and not self._http.closed:
+            task = asyncio.create_task(self._ping_urls([att.url for att in message.attachments]))
+            self._ping_tasks.add(task)
+            task.add_done_callback(self._ping_tasks.discard)
 
-        # Preserve ALL attachment URLs and metadata BEFORE they become inaccessible
+        # Enhanced attachment logging if available
+        self._enhanced_log(message, "delete")
+
+        atts = message.attachments
+        n_total = len(atts)
+        logger.info(f"🗑️ Processing deletion of message with {n_total} attachments")
+
+        # One pass over every attachment: preserve ALL URLs and metadata BEFORE they
+        # become inaccessible and classify them; the display listing covers the first few
+        log_urls = logger.isEnabledFor(logging.INFO)
         preserved_attachments = []
-        for attachment in message.attachments:
-            preserved_data = {
-                'filename': attachment.filename,
-                'size': attachment.size,
-                'url': attachment.url,
-                'proxy_url': attachment.proxy_url,
-                'id': attachment.id,
-                'content_type': getattr(attachment, 'content_type', None),
-                'width': getattr(attachment, 'width', None),
-                'height': getattr(attachment, 'height', None),
-                'is_spoiler': attachment.is_spoiler(),
-                'preserved_at': datetime.utcnow().isoformat()
-            }
-            preserved_attachments.append(preserved_data)
-
-            # Log each URL for debugging
-            logger.info(f"📎 PRESERVING: {attachment.filename}")
-            logger.info(f"   🔗 URL: {attachment.url}")
-            logger.info(f"   📏 Size: {attachment.size} bytes")
-
-        # Separate images from other files
-        images = [att for att in message.attachments if self.base.is_image_file(att.filename)]
-        other_files = [att for att in message.attachments if not self.base.is_image_file(att.filename)]
+        images = []
+        other_files = []
+        attachments_info = []
+        url_log_lines = [f"🔍 PRESERVED ATTACHMENT DATA for message {message_id}:"]
+
+        # One clock reading for every preserved attachment and the deletion details
+        now = datetime.now(timezone.utc)
+        preserved_at = now.isoformat()
+        total_size = 0
+        is_image_file = self.base.is_image_file
+
+        for i, attachment in enumerate(atts):
+            filename = attachment.filename
+            url = attachment.url
+            att_id = attachment.id
+            size = attachment.size
+            content_type = getattr(attachment, 'content_type', None)
+
+            preserved = PreservedAttachment(
+                filename, size, url, attachment.proxy_url, att_id, content_type,
+                getattr(attachment, 'width', None), getattr(attachment, 'height', None),
+                attachment.is_spoiler(), preserved_at
+            )
+            preserved_attachments.append(preserved)
+            if log_urls:
+                url_log_lines.append(f"📎 PRESERVING: {filename}")
+                url_log_lines.append(f"   🔗 URL: {url}")
+                url_log_lines.append(f"   📏 Size: {size} bytes")
+
+            if is_image_file(filename):
+                images.append(attachment)
+            else:
+                other_files.append(attachment)
+            total_size += size
+
+        # List only the first attachments to avoid embed limits
+        preserved_urls = preserved_attachments[:_MAX_LISTED]
+        for preserved in preserved_urls:
+            emoji = self.base.get_file_type_emoji(preserved.filename)
+
+            # Create attachment info with preserved data
+            type_info = f" • {preserved.content_type}" if preserved.content_type else ""
+            attachments_info.append(f"{emoji} **{preserved.filename}** ({_fmt_size(preserved.size)}){type_info}")
+
+        if n_total > _MAX_LISTED:
+            attachments_info.append(f"... and {n_total - _MAX_LISTED} more files")
+
+        total_mb = total_size / _MB
+
+        # Log every preserved URL for debugging, as one record per message
+        if log_urls:
+            logger.info("\n".join(url_log_lines))
 
         # Determine title
-        if images and other_files:
-            title = f"🗑️ Files & Images Deleted ({len(message.attachments)} total)"
-        elif images:
-            title = f"🗑️ Image{'s' if len(images) > 1 else ''} Deleted ({len(images)} image{'s' if len(images) > 1 else ''})"
-        else:
-            title = f"🗑️ File{'s' if len(other_files) > 1 else ''} Deleted ({len(other_files)} file{'s' if len(other_files) > 1 else ''})"
+        title = _pick_title(_DELETE_TITLES, images, other_files)
 
         # Create embed
-        embed = discord.Embed(title=title, color=discord.Color.red())
+        embed = discord.Embed(title=title, color=_COLOR_RED)
 
         # Add user information
-        self.base.add_user_info(embed, message.author, "Author")
+        self.base.add_user_info(embed, author, "Author")
 
         # Add channel and message info
         embed.add_field(name="Channel", value=message.channel.mention, inline=True)
-        embed.add_field(name="Message ID", value=str(message.id), inline=True)
+        embed.add_field(name="Message ID", value=message_id, inline=True)
 
         # Add message content if any
         if message.content:
             content = self.base.format_content(message.content, 1000)
             embed.add_field(name="Content", value=f"```{content}```", inline=False)
 
-        # Process attachments
-        attachments_info = []
-        preserved_urls = []
-
-        for i, attachment in enumerate(message.attachments):
-            emoji = self.base.get_file_type_emoji(attachment.filename)
-            file_size = f"{attachment.size / 1024:.1f} KB" if attachment.size < 1024 * 1024 else f"{attachment.size / (1024 * 1024):.1f} MB"
-
-            # Create attachment info with preserved data
-            if hasattr(attachment, 'content_type') and attachment.content_type:
-                type_info = f" • {attachment.content_type}"
-            else:
-                type_info = ""
-
-            attachments_info.append(f"{emoji} **{attachment.filename}** ({file_size}){type_info}")
-
-            # Store the URL that was preserved
-            preserved_urls.append({
-                'filename': attachment.filename,
-                'url': attachment.url,
-                'size': attachment.size,
-                'id': attachment.id
-            })
-
-            # Log the URL for debugging/monitoring
-            logger.info(f"📎 Deleted attachment URL: {attachment.url}")
-
-            # Limit to avoid embed limits
-            if i >= 9:
-                attachments_info.append(f"... and {len(message.attachments) - 10} more files")
-                break
-
         embed.add_field(
-            name=f"Deleted Attachments ({len(message.attachments)})",
-            value="\n".join(attachments_info),
+            name=f"Deleted Attachments ({n_total})",
+            value=_join_capped(attachments_info),
             inline=False
         )
 
@@ -334,101 +499,67 @@ class AttachmentLogs(LoggingModule):
         if len(preserved_urls) <= 3:
             url_list = []
             for url_data in preserved_urls:
-                url_list.append(f"• [{url_data['filename']}]({url_data['url']}) (ID: {url_data['id']})")
+                url_list.append(f"• [{url_data.filename}]({url_data.url}) (ID: {url_data.id})")
 
             embed.add_field(
                 name="🔗 Preserved URLs (Now Inaccessible)",
-                value="\n".join(url_list),
+                value=_join_capped(url_list),
                 inline=False
             )
 
         # Enhanced note about deleted files with technical details
+        n_preserved = len(preserved_urls)
         embed.add_field(
             name="⚠️ Technical Information",
             value="**Discord CDN Behavior:**\n"
-                  f"• {len(preserved_urls)} file URL(s) were captured before deletion\n"
-                  "• URLs become HTTP 404 immediately upon message deletion\n"
-                  "• Files are removed from Discord's CDN permanently\n"
-                  "• Only metadata (filename, size, type) is preserved\n"
-                  f"• Total deleted content: {sum(url['size'] for url in preserved_urls) / (1024 * 1024):.2f} MB",
+                  f"• {n_preserved} file URL(s) were captured before deletion\n"
+                  f"{_CDN_BEHAVIOR_NOTE}"
+                  f"• Total deleted content: {total_mb:.2f} MB",
             inline=False
         )
 
         # Add deletion timestamp with precise timing
         embed.add_field(
             name="🕒 Deletion Details",
-            value=f"**When:** <t:{int(datetime.utcnow().timestamp())}:F>\n"
-                  f"**Detected:** {datetime.utcnow().strftime('%H:%M:%S.%f')[:-3]} UTC\n"
-                  f"**URLs Preserved:** {len(preserved_urls)}/{len(message.attachments)}",
+            value=f"**When:** <t:{int(now.timestamp())}:F>\n"
+                  f"**Detected:** {now.strftime('%H:%M:%S.%f')[:-3]} UTC\n"
+                  f"**URLs Preserved:** {n_preserved}/{n_total}",
             inline=True
         )
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, message.author, guild_id)
-        await add_avatar()
-
-        # Store preserved data in logs for potential recovery/analysis
-        logger.info(f"🔍 PRESERVED ATTACHMENT DATA for message {message.id}:")
-        for url_data in preserved_urls:
-            logger.info(f"   📎 {url_data['filename']}: {url_data['url']}")
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, author, config)
 
         # Send log
         await self.base.send_log(message.guild, 'image_delete', embed)
 
         # Log to interaction logger
         log_message(message, "deleted_with_attachments",
-                    f"Content: {message.content[:100]}... | Attachments: {len(message.attachments)}")
+                    f"Content: {message.content[:100]}... | Attachments: {n_total}")
 
-    async def send_multiple_image_logs(self, message, attachments, guild_id):
-        """Send additional embeds for multiple images (when there are many images)"""
-        try:
-            from utils.database import get_guild_config
-            config = await get_guild_config(guild_id)
-            if not config or not config.get('log_channel_id'):
-                return
-
-            log_channel = message.guild.get_channel(int(config['log_channel_id']))
-            if not log_channel:
-                return
-
-            images = [att for att in attachments if self.base.is_image_file(att.filename)]
-
-            # Send additional embeds for images 2, 3, 4+ (first is in main embed)
-            for i, attachment in enumerate(images[1:], 2):
-                embed = discord.Embed(
-                    title=f"🖼️ Image {i}/{len(images)} (continued)",
-                    color=discord.Color.blue()
-                )
-
-                embed.set_image(url=attachment.url)
-
-                file_size = f"{attachment.size / 1024:.1f} KB" if attachment.size < 1024 * 1024 else f"{attachment.size / (1024 * 1024):.1f} MB"
-                embed.add_field(
-                    name="File Info",
-                    value=f"**{attachment.filename}** ({file_size})",
-                    inline=False
-                )
-
-                embed.add_field(
-                    name="Direct Link",
-                    value=f"[Open Image]({attachment.url})",
-                    inline=True
-                )
-
-                # Apply guild styling
-                if config.get('embed_color'):
-                    try:
-                        embed.color = discord.Color(int(config['embed_color'].replace('#', ''), 16))
-                    except:
-                        pass
-
-                if config.get('show_timestamps', True):
-                    embed.timestamp = datetime.utcnow()
-
-                await log_channel.send(embed=embed)
+    def build_image_embed(self, attachment: discord.Attachment, index: int, total: int) -> discord.Embed:
+        """Build the continuation embed for one image of a multi-image upload"""
+        embed = discord.Embed(
+            title=f"🖼️ Image {index}/{total} (continued)",
+            color=_COLOR_BLUE
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to send additional image logs: {e}")
+        embed.set_image(url=attachment.url)
+
+        embed.add_field(
+            name="File Info",
+            value=_embed_value(f"**{attachment.filename}** ({_fmt_size(attachment.size)})"),
+            inline=False
+        )
+
+        embed.add_field(
+            name="Direct Link",
+            value=_embed_value(f"[Open Image]({attachment.url})"),
+            inline=True
+        )
+
+        return embed
 
     async def get_attachment_statistics(self, guild_id: str, days: int = 7):
         """Get attachment upload/deletion statistics for a guild"""
@@ -5,174 +5,339 @@ Enhanced shared functionality with flexible event-to-channel routing
 
 import discord
 from discord.ext import commands
+import asyncio
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, FrozenSet, Final, Tuple, Callable, Awaitable
 
 from utils.database import (
-    get_guild_config, is_logging_enabled, is_event_enabled,
-    get_event_channel, get_all_event_channels
+    get_guild_config, is_event_enabled,
+    get_event_channel, get_all_event_channels,
+    cached_guild_config, cached_event_channel, is_logging_and_event_enabled
 )
 
 logger = logging.getLogger(__name__)
 
+# Seconds a resolved (guild, event type) -> channel entry stays valid
+_CHANNEL_CACHE_TTL = 60
+
+# Outgoing log queue: capacity, and how long the worker gathers logs before sending a batch
+_QUEUE_MAXSIZE = 10_000
+_BATCH_WINDOW = 0.25
+
+# Called once a queued log has actually been delivered
+OnSent = Callable[[], Awaitable[Any]]
+
+# Discord allows at most 10 embeds and 6000 embed characters per message
+_MAX_EMBEDS = 10
+_MAX_MESSAGE_CHARS = 6000
+
+# File type categorization, shared by every BaseLogger
+FILE_TYPES: Final[Dict[str, FrozenSet[str]]] = {
+    'images': frozenset({'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.svg', '.tiff', '.ico'}),
+    'documents': frozenset({'.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt', '.xls', '.xlsx', '.ppt', '.pptx'}),
+    'videos': frozenset({'.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v'}),
+    'audio': frozenset({'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'}),
+    'archives': frozenset({'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'}),
+    'code': frozenset({'.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.php', '.rb', '.go'}),
+}
+
+# Emoji shown for each file category in attachment listings, and for anything uncategorized
+_CATEGORY_EMOJI: Final[Dict[str, str]] = {
+    'images': "🖼️",
+    'documents': "📄",
+    'videos': "🎥",
+    'audio': "🎵",
+    'archives': "📦",
+    'code': "💻",
+}
+_DEFAULT_FILE_EMOJI: Final = "📎"
+
+# Flat extension lookups so classifying a filename is a single dict get
+_EXT_TO_CATEGORY: Final[Dict[str, str]] = {
+    ext: category for category, extensions in FILE_TYPES.items() for ext in extensions
+}
+_EXT_TO_EMOJI: Final[Dict[str, str]] = {
+    ext: _CATEGORY_EMOJI[category] for ext, category in _EXT_TO_CATEGORY.items()
+}
+
+
+def _file_extension(filename: str) -> str:
+    """Lowercased extension including the dot, or '' if the name has none"""
+    idx = filename.rfind('.')
+    return filename[idx:].lower() if idx >= 0 else ''
+
 
 class BaseLogger:
     """Enhanced base class with smart channel routing for all logging modules"""
 
+    FILE_TYPES = FILE_TYPES
+
     def __init__(self, bot):
         self.bot = bot
 
-        # File type categorization
-        self.file_types = {
-            'images': {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.svg', '.tiff', '.ico'},
-            'documents': {'.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt', '.xls', '.xlsx', '.ppt', '.pptx'},
-            'videos': {'.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v'},
-            'audio': {'.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a'},
-            'archives': {'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'},
-            'code': {'.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.php', '.rb', '.go'}
-        }
+        # (guild_id, event_type) -> (resolved_at, validated channel or None)
+        self._channel_cache: Dict[Tuple[str, str], Tuple[float, Optional[discord.TextChannel]]] = {}
+
+        # Logs are queued by the event handlers and sent by a background worker; close() queues None to stop it
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+        self._worker_task: Optional[asyncio.Task] = None
 
     def get_file_type_emoji(self, filename: str) -> str:
         """Get appropriate emoji for file type"""
-        filename_lower = filename.lower()
-
-        if any(filename_lower.endswith(ext) for ext in self.file_types['images']):
-            return "🖼️"
-        elif any(filename_lower.endswith(ext) for ext in self.file_types['documents']):
-            return "📄"
-        elif any(filename_lower.endswith(ext) for ext in self.file_types['videos']):
-            return "🎥"
-        elif any(filename_lower.endswith(ext) for ext in self.file_types['audio']):
-            return "🎵"
-        elif any(filename_lower.endswith(ext) for ext in self.file_types['archives']):
-            return "📦"
-        elif any(filename_lower.endswith(ext) for ext in self.file_types['code']):
-            return "💻"
-        else:
-            return "📎"
+        return _EXT_TO_EMOJI.get(_file_extension(filename), _DEFAULT_FILE_EMOJI)
 
     def is_image_file(self, filename: str) -> bool:
         """Check if a file is an image based on extension"""
-        return any(filename.lower().endswith(ext) for ext in self.file_types['images'])
+        return _EXT_TO_CATEGORY.get(_file_extension(filename)) == 'images'
 
     def categorize_file(self, filename: str) -> str:
         """Categorize file by extension"""
-        filename_lower = filename.lower()
-        for category, extensions in self.file_types.items():
-            if any(filename_lower.endswith(ext) for ext in extensions):
-                return category
-        return 'other'
+        return _EXT_TO_CATEGORY.get(_file_extension(filename), 'other')
 
-    async def get_log_channel(self, guild: discord.Guild, event_type: str) -> Optional[discord.TextChannel]:
+    async def get_log_channel(
+        self, guild: discord.Guild, event_type: str
+    ) -> Tuple[Optional[discord.TextChannel], Optional[Dict[str, Any]]]:
         """
         Enhanced channel resolution with validation and cleanup
+
+        Returns the channel together with the guild config it was resolved from,
+        so callers don't fetch the config again. The resolved channel is cached
+        per event type for _CHANNEL_CACHE_TTL seconds.
         """
         guild_id = str(guild.id)
+        key = (guild_id, event_type)
 
         try:
-            # Level 1: Try to get event-specific channel
-            event_channel_id = await get_event_channel(guild_id, event_type)
-            if event_channel_id:
-                event_channel = guild.get_channel(int(event_channel_id))
-                if event_channel and isinstance(event_channel, discord.TextChannel):
-                    # CHANGE: Add permission validation
-                    bot_perms = event_channel.permissions_for(guild.me)
-                    if bot_perms.send_messages and bot_perms.embed_links:
-                        logger.debug(f"Using event-specific channel {event_channel.name} for {event_type}")
-                        return event_channel
-                    else:
-                        logger.warning(f"Missing permissions in event channel {event_channel.name}")
-                        # Clean up invalid mapping
-                        try:
-                            from utils.database import remove_event_channel
-                            await remove_event_channel(guild_id, event_type)
-                        except Exception as cleanup_error:
-                            logger.error(f"Failed to cleanup invalid channel mapping: {cleanup_error}")
+            config = await cached_guild_config(guild_id)
+
+            # Nothing to route when logging is off for the guild
+            if not config or not config.get('logging_enabled'):
+                return None, config
+
+            # Channel deletes and permission changes invalidate the entry
+            cached = self._channel_cache.get(key)
+            if cached and time.monotonic() - cached[0] < _CHANNEL_CACHE_TTL:
+                return cached[1], config
+
+            channel = await self._resolve_log_channel(guild, event_type, config)
+        except Exception as e:
+            logger.error("Error resolving log channel for %s: %s", event_type, e)
+            return None, None
+
+        self._channel_cache[key] = (time.monotonic(), channel)
+        return channel, config
+
+    async def _resolve_log_channel(
+        self, guild: discord.Guild, event_type: str, config: Optional[Dict[str, Any]]
+    ) -> Optional[discord.TextChannel]:
+        """Walk the event channel -> default channel fallback chain"""
+        guild_id = str(guild.id)
+
+        # Level 1: Try to get event-specific channel
+        event_channel_id = await cached_event_channel(guild_id, event_type)
+        if event_channel_id:
+            event_channel = guild.get_channel(int(event_channel_id))
+            if event_channel and isinstance(event_channel, discord.TextChannel):
+                # CHANGE: Add permission validation
+                bot_perms = event_channel.permissions_for(guild.me)
+                if bot_perms.send_messages and bot_perms.embed_links:
+                    logger.debug("Using event-specific channel %s for %s", event_channel.name, event_type)
+                    return event_channel
                 else:
-                    logger.warning(f"Event-specific channel {event_channel_id} not found for {event_type}")
-                    # Clean up stale mapping
+                    logger.warning("Missing permissions in event channel %s", event_channel.name)
+                    # Clean up invalid mapping
                     try:
                         from utils.database import remove_event_channel
                         await remove_event_channel(guild_id, event_type)
                     except Exception as cleanup_error:
-                        logger.error(f"Failed to cleanup stale channel mapping: {cleanup_error}")
-
-            # Level 2: Fall back to default guild log channel with validation
-            config = await get_guild_config(guild_id)
-            if config and config.get('log_channel_id'):
-                default_channel = guild.get_channel(int(config['log_channel_id']))
-                if default_channel and isinstance(default_channel, discord.TextChannel):
-                    # CHANGE: Add permission validation for default channel too
-                    bot_perms = default_channel.permissions_for(guild.me)
-                    if bot_perms.send_messages and bot_perms.embed_links:
-                        logger.debug(f"Using default log channel {default_channel.name} for {event_type}")
-                        return default_channel
-                    else:
-                        logger.warning(f"Missing permissions in default log channel {default_channel.name}")
+                        logger.error("Failed to cleanup invalid channel mapping: %s", cleanup_error)
+            else:
+                logger.warning("Event-specific channel %s not found for %s", event_channel_id, event_type)
+                # Clean up stale mapping
+                try:
+                    from utils.database import remove_event_channel
+                    await remove_event_channel(guild_id, event_type)
+                except Exception as cleanup_error:
+                    logger.error("Failed to cleanup stale channel mapping: %s", cleanup_error)
+
+        # Level 2: Fall back to default guild log channel with validation
+        if config and config.get('log_channel_id'):
+            default_channel = guild.get_channel(config['log_channel_id'])
+            if default_channel and isinstance(default_channel, discord.TextChannel):
+                # CHANGE: Add permission validation for default channel too
+                bot_perms = default_channel.permissions_for(guild.me)
+                if bot_perms.send_messages and bot_perms.embed_links:
+                    logger.debug("Using default log channel %s for %s", default_channel.name, event_type)
+                    return default_channel
                 else:
-                    logger.warning(f"Default log channel {config['log_channel_id']} not found")
+                    logger.warning("Missing permissions in default log channel %s", default_channel.name)
+            else:
+                logger.warning("Default log channel %s not found", config['log_channel_id'])
+
+        # Level 3: No valid channels configured
+        logger.warning("No valid log channel configured for %s in guild %s", event_type, guild.name)
+        return None
+
+    def invalidate_guild(self, guild_id: str):
+        """Drop cached channel resolutions for a guild after its config or channels change"""
+        guild_id = str(guild_id)
+        for key in [key for key in self._channel_cache if key[0] == guild_id]:
+            del self._channel_cache[key]
+
+    async def send_log(self, guild: discord.Guild, event_type: str, embed: discord.Embed,
+                       on_sent: Optional[OnSent] = None):
+        """Enhanced send log with smart channel routing"""
+        await self.send_log_multi(guild, event_type, [embed], on_sent)
 
-            # Level 3: No valid channels configured
-            logger.warning(f"No valid log channel configured for {event_type} in guild {guild.name}")
-            return None
+    async def send_log_multi(self, guild: discord.Guild, event_type: str, embeds: List[discord.Embed],
+                             on_sent: Optional[OnSent] = None):
+        """Queue up to 10 embeds to be sent as a single log message with smart channel routing
 
-        except Exception as e:
-            logger.error(f"Error resolving log channel for {event_type}: {e}")
-            return None
+        on_sent is awaited after Discord accepts the message, never for logs that are dropped.
+        """
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._drain_queue())
 
-    async def send_log(self, guild: discord.Guild, event_type: str, embed: discord.Embed):
-        """Enhanced send log with smart channel routing"""
         try:
-            # Get the appropriate channel for this event type
-            log_channel = await self.get_log_channel(guild, event_type)
-            if not log_channel:
-                logger.warning(f"No log channel available for {event_type} in guild {guild.name}")
-                return
-
-            guild_id = str(guild.id)
-            config = await get_guild_config(guild_id)
-
-            # Apply guild-specific styling
-            if config and config.get('embed_color'):
-                try:
-                    embed.color = discord.Color(int(config['embed_color'].replace('#', ''), 16))
-                except:
-                    pass  # Keep default color if invalid
+            self._queue.put_nowait((guild, event_type, embeds[:_MAX_EMBEDS], datetime.now(timezone.utc), on_sent))
+        except asyncio.QueueFull:
+            logger.warning("Log queue full, dropping %s log for guild %s", event_type, guild.name)
+
+    async def _drain_queue(self):
+        """Background worker: send queued logs in batches gathered over _BATCH_WINDOW until close() stops it"""
+        stopping = False
+        while not stopping:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(_BATCH_WINDOW)
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            stopping = any(item is None for item in batch)
+            batch = [item for item in batch if item is not None]
+            if not batch:
+                continue
 
-            # Add timestamp if enabled
-            if config and config.get('show_timestamps', True):
-                embed.timestamp = datetime.utcnow()
+            try:
+                await self._send_batch(batch)
+            except Exception as e:
+                logger.error("Unexpected error sending log batch: %s", e)
 
-            # Send the log message
-            await log_channel.send(embed=embed)
+    async def _send_batch(
+        self, batch: List[Tuple[discord.Guild, str, List[discord.Embed], datetime, Optional[OnSent]]]
+    ):
+        """Route and style a batch of queued logs, then send them per channel concurrently"""
+        by_channel: Dict[int, Tuple[discord.TextChannel, List[Tuple[List[discord.Embed], Optional[OnSent]]]]] = {}
 
-            logger.debug(f"Sent {event_type} log to {log_channel.name} in {guild.name}")
+        for guild, event_type, embeds, queued_at, on_sent in batch:
+            # Get the appropriate channel for this event type
+            log_channel, config = await self.get_log_channel(guild, event_type)
+            if not log_channel:
+                if config and config.get('logging_enabled'):
+                    logger.warning("No log channel available for %s in guild %s", event_type, guild.name)
+                continue
+
+            # Resolve guild-specific styling once for every embed in the message
+            custom_color = None
+            if config and config.get('embed_color_value') is not None:
+                custom_color = discord.Color(config['embed_color_value'])
+
+            timestamp = queued_at if config and config.get('show_timestamps', True) else None
+
+            for embed in embeds:
+                if custom_color is not None:
+                    embed.color = custom_color
+                if timestamp is not None:
+                    embed.timestamp = timestamp
+
+            by_channel.setdefault(log_channel.id, (log_channel, []))[1].append((embeds, on_sent))
+
+        await asyncio.gather(*(
+            self._send_to_channel(channel, groups) for channel, groups in by_channel.values()
+        ))
+
+    async def _send_to_channel(self, channel: discord.TextChannel,
+                               groups: List[Tuple[List[discord.Embed], Optional[OnSent]]]):
+        """Pack queued logs for one channel into as few messages as possible, keeping their order"""
+        pending: List[Tuple[List[discord.Embed], Optional[OnSent]]] = []
+        pending_count = pending_chars = 0
+        for group in groups:
+            embeds = group[0]
+            chars = sum(len(embed) for embed in embeds)
+            if pending and (pending_count + len(embeds) > _MAX_EMBEDS
+                            or pending_chars + chars > _MAX_MESSAGE_CHARS):
+                await self._send_embeds(channel, pending)
+                pending = []
+                pending_count = pending_chars = 0
+            pending.append(group)
+            pending_count += len(embeds)
+            pending_chars += chars
+
+        if pending:
+            await self._send_embeds(channel, pending)
+
+    async def _send_embeds(self, channel: discord.TextChannel,
+                           groups: List[Tuple[List[discord.Embed], Optional[OnSent]]]):
+        """Send packed logs as one message, resending them one log per message if Discord rejects it"""
+        embeds = [embed for group, _ in groups for embed in group]
+        try:
+            await channel.send(embeds=embeds)
+            logger.debug("Sent %s log embeds to %s in %s", len(embeds), channel.name, channel.guild.name)
 
         except discord.Forbidden:
-            logger.error(f"Missing permissions to send log to channel in guild {guild.name}")
+            logger.error("Missing permissions to send log to channel in guild %s", channel.guild.name)
+            self.invalidate_guild(channel.guild.id)
         except discord.HTTPException as e:
-            logger.error(f"HTTP error sending log message: {e}")
+            if len(groups) == 1:
+                logger.error("HTTP error sending log message: %s", e)
+                return
+
+            # One bad log shouldn't take the unrelated logs packed with it down too
+            logger.warning("HTTP error sending %s packed logs, resending separately: %s", len(groups), e)
+            for group in groups:
+                await self._send_embeds(channel, [group])
         except Exception as e:
-            logger.error(f"Unexpected error sending log message: {e}")
+            logger.error("Unexpected error sending log message: %s", e)
+        else:
+            for _, on_sent in groups:
+                if on_sent is not None:
+                    try:
+                        await on_sent()
+                    except Exception as e:
+                        logger.error("Error in log sent callback: %s", e)
+
+    async def close(self):
+        """Stop the send worker once it has sent everything queued, then flush anything queued since"""
+        if self._worker_task and not self._worker_task.done():
+            await self._queue.put(None)
+            await self._worker_task
+        self._worker_task = None
+
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            await self._send_batch(batch)
 
     async def check_logging_enabled(self, guild_id: str, event_type: str) -> bool:
         """Check if logging is enabled for guild and specific event type"""
         try:
-            # Check if general logging is enabled
-            if not await is_logging_enabled(guild_id):
-                logger.debug(f"Logging disabled for guild {guild_id}")
+            # Guild switch and event switch come from one cached lookup
+            logging_enabled, event_enabled = await is_logging_and_event_enabled(guild_id, event_type)
+
+            if not logging_enabled:
+                logger.debug("Logging disabled for guild %s", guild_id)
                 return False
 
-            # Check if specific event logging is enabled
-            if not await is_event_enabled(guild_id, event_type):
-                logger.debug(f"Event {event_type} disabled for guild {guild_id}")
+            if not event_enabled:
+                logger.debug("Event %s disabled for guild %s", event_type, guild_id)
                 return False
 
             return True
 
         except Exception as e:
-            logger.error(f"Error checking logging enabled for {event_type}: {e}")
+            logger.error("Error checking logging enabled for %s: %s", event_type, e)
             return False
 
     def create_base_embed(self, title: str, color: discord.Color, guild: discord.Guild) -> discord.Embed:
@@ -188,19 +353,17 @@ class BaseLogger:
             inline=True
         )
 
-    def add_guild_avatar(self, embed: discord.Embed, user: discord.User, guild_id: str):
-        """Add user avatar to embed if enabled in guild settings"""
-
-        async def _add_avatar():
-            try:
-                config = await get_guild_config(guild_id)
-                if config and config.get('show_avatars', True) and user.avatar:
-                    embed.set_thumbnail(url=user.avatar.url)
-            except Exception as e:
-                logger.debug(f"Error adding avatar: {e}")
+    def guild_avatar_url(self, user: discord.User, config: Optional[Dict[str, Any]]) -> Optional[str]:
+        """User avatar URL if avatars are enabled in the already-fetched guild config"""
+        if config and config.get('show_avatars', True) and user.avatar:
+            return user.avatar.url
+        return None
 
-        # This is a sync method, so we'll handle avatar addition in the calling async method
-        return _add_avatar
+    def apply_guild_avatar(self, embed: discord.Embed, user: discord.User, config: Optional[Dict[str, Any]]):
+        """Add user avatar to embed if enabled in the already-fetched guild config"""
+        avatar_url = self.guild_avatar_url(user, config)
+        if avatar_url:
+            embed.set_thumbnail(url=avatar_url)
 
     def format_content(self, content: str, max_length: int = 1000) -> str:
         """Format content for embed with length limits"""
@@ -243,11 +406,12 @@ class BaseLogger:
     async def test_channel_routing(self, guild: discord.Guild, event_type: str) -> Dict[str, Any]:
         """Test channel routing for a specific event type (for debugging)"""
         guild_id = str(guild.id)
+        config = await get_guild_config(guild_id)
 
         test_result = {
             'event_type': event_type,
             'guild_id': guild_id,
-            'logging_enabled': await is_logging_enabled(guild_id),
+            'logging_enabled': bool(config and config.get('logging_enabled', False)),
             'event_enabled': await is_event_enabled(guild_id, event_type),
             'resolved_channel': None,
             'resolution_path': [],
@@ -275,7 +439,6 @@ class BaseLogger:
                     test_result['resolution_path'].append("❌ Event-specific channel not accessible")
 
             # Check default channel
-            config = await get_guild_config(guild_id)
             if config and config.get('log_channel_id'):
                 test_result['resolution_path'].append(f"Checking default channel: {config['log_channel_id']}")
                 default_channel = guild.get_channel(int(config['log_channel_id']))
@@ -305,7 +468,12 @@ class LoggingModule:
 
     def __init__(self, bot):
         self.bot = bot
-        self.base = BaseLogger(bot)
+
+        # All logging modules share one BaseLogger, so routing caches and the send queue are per bot
+        base = getattr(bot, 'logging_base', None)
+        if base is None:
+            base = bot.logging_base = BaseLogger(bot)
+        self.base = base
 
     def cog_check(self, ctx):
         """Check if logging module is enabled"""
@@ -332,8 +500,8 @@ class LoggingModule:
         ]
 
         if routing_info.get('event_mappings'):
-            debug_lines.append("\n📋 **Event Mappings:**")
-            for event, channel_id in routing_info['event_mappings'].items():
-                debug_lines.append(f"  • {event} → {channel_id}")
+            debug_lines.append("\n📋 **Event Mappings:**\n" + "\n".join(
+                f"  • {event} → {channel_id}" for event, channel_id in routing_info['event_mappings'].items()
+            ))
 
         return "\n".join(debug_lines)
\ No newline at end of file
@@ -5,14 +5,39 @@ Handles member join/leave/ban/unban events
 
 import discord
 from discord.ext import commands
+import asyncio
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
 from .base import LoggingModule
+from utils.database import cached_guild_config
 from utils.bot_logger import log_member, log_event
 
 logger = logging.getLogger(__name__)
 
+# Seconds fetched ban/unban audit log entries are reused for later events
+_AUDIT_CACHE_TTL = 10
+
+# Entries per audit log fetch, enough to cover a burst of bans served by one request
+_AUDIT_FETCH_LIMIT = 50
+
+# Embed colors as raw values for Embed.from_dict
+_COLOR_GREEN = discord.Color.green().value
+_COLOR_RED = discord.Color.red().value
+_COLOR_DARK_RED = discord.Color.dark_red().value
+
+
+def _find_target(entries: List[discord.AuditLogEntry], target_id: int) -> Optional[discord.AuditLogEntry]:
+    """First audit log entry whose target is target_id"""
+    return next((entry for entry in entries if entry.target.id == target_id), None)
+
+
+def _event_description(now_ts: int, user_id: int) -> str:
+    """Event time and copyable user ID, shown as the embed description instead of two fields"""
+    return f"🕒 <t:{now_ts}:F> • ID `{user_id}`"
+
 
 class MemberLogs(LoggingModule):
     """Handles member-related logging events"""
@@ -28,10 +53,55 @@ class MemberLogs(LoggingModule):
             'member_unban': 'Member Unbans'
         }
 
+        # (guild_id, action) -> (fetched_at, recent audit log entries)
+        self._audit_cache: Dict[Tuple[int, discord.AuditLogAction], Tuple[float, List[discord.AuditLogEntry]]] = {}
+
+        # (guild_id, action) -> audit log fetch shared by concurrent handlers
+        self._audit_inflight: Dict[Tuple[int, discord.AuditLogAction], asyncio.Task] = {}
+
     async def setup(self):
         """Setup method called when module is loaded"""
         logger.info("Member logging module initialized")
 
+    async def find_audit_entry(self, guild: discord.Guild, action: discord.AuditLogAction,
+                               target_id: int) -> Optional[discord.AuditLogEntry]:
+        """Find the recent audit log entry for a target, reusing entries fetched in the last few seconds
+
+        Concurrent lookups for the same guild and action share one in-flight fetch.
+        """
+        key = (guild.id, action)
+
+        cached = self._audit_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _AUDIT_CACHE_TTL:
+            entry = _find_target(cached[1], target_id)
+            if entry:
+                return entry
+
+        # A fetch that was already running may predate this event, so allow one fresh fetch after it
+        for _ in range(2):
+            task = self._audit_inflight.get(key)
+            joined = task is not None
+            if task is None:
+                task = asyncio.ensure_future(self._fetch_audit_entries(guild, action))
+                self._audit_inflight[key] = task
+
+            entry = _find_target(await asyncio.shield(task), target_id)
+            if entry or not joined:
+                return entry
+        return None
+
+    async def _fetch_audit_entries(self, guild: discord.Guild,
+                                   action: discord.AuditLogAction) -> List[discord.AuditLogEntry]:
+        key = (guild.id, action)
+        task = asyncio.current_task()
+        try:
+            entries = [entry async for entry in guild.audit_logs(action=action, limit=_AUDIT_FETCH_LIMIT)]
+            self._audit_cache[key] = (time.monotonic(), entries)
+            return entries
+        finally:
+            if self._audit_inflight.get(key) is task:
+                del self._audit_inflight[key]
+
     async def on_member_join(self, member):
         """Log member joins"""
         guild_id = str(member.guild.id)
@@ -40,66 +110,44 @@ class MemberLogs(LoggingModule):
         if not await self.base.check_logging_enabled(guild_id, 'member_join'):
             return
 
-        logger.info(f"👋 Processing member join: {member} in {member.guild.name}")
-
-        # Create embed for member join
-        embed = discord.Embed(
-            title="👋 Member Joined",
-            color=discord.Color.green()
-        )
-
-        # Add member information
-        self.base.add_user_info(embed, member, "Member")
-
-        # Add account creation info
-        account_age = datetime.utcnow() - member.created_at
-        embed.add_field(
-            name="Account Created",
-            value=f"<t:{int(member.created_at.timestamp())}:R>\n({account_age.days} days ago)",
-            inline=True
-        )
-
-        # Add member count
-        embed.add_field(
-            name="Member Count",
-            value=f"#{member.guild.member_count:,}",
-            inline=True
-        )
-
-        # Add join timestamp
-        embed.add_field(
-            name="🕒 Joined At",
-            value=f"<t:{int(datetime.utcnow().timestamp())}:F>",
-            inline=True
-        )
+        now_ts = int(time.time())
+
+        logger.info("👋 Processing member join: %s in %s", member, member.guild.name)
+
+        # Account creation info
+        created_ts = int(member.created_at.timestamp())
+        account_age_days = (now_ts - created_ts) // 86400
+
+        fields = [
+            {'name': "Member", 'value': f"{member.mention} ({member})", 'inline': True},
+            {'name': "Account Created", 'value': f"<t:{created_ts}:R>\n({account_age_days} days ago)", 'inline': True},
+            {'name': "Member Count", 'value': f"#{member.guild.member_count:,}", 'inline': True},
+        ]
 
         # Check for potential spam accounts (very new accounts)
-        if account_age.days < 7:
-            embed.add_field(
-                name="⚠️ Notice",
-                value=f"Account is only {account_age.days} days old",
-                inline=False
-            )
-
-        # Add user ID for easy copying
-        embed.add_field(
-            name="User ID",
-            value=f"`{member.id}`",
-            inline=True
-        )
+        if account_age_days < 7:
+            fields.append({'name': "⚠️ Notice", 'value': f"Account is only {account_age_days} days old", 'inline': False})
+
+        # Create embed for member join with all fields at once
+        embed = discord.Embed.from_dict({
+            'title': "👋 Member Joined",
+            'description': _event_description(now_ts, member.id),
+            'color': _COLOR_GREEN,
+            'fields': fields
+        })
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, member, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, member, config)
 
         # Send log
         await self.base.send_log(member.guild, 'member_join', embed)
 
         # Log to interaction logger
         log_member(member, "join", {
-            'account_age_days': account_age.days,
+            'account_age_days': account_age_days,
             'guild_member_count': member.guild.member_count,
-            'is_new_account': account_age.days < 7
+            'is_new_account': account_age_days < 7
         })
 
     async def on_member_remove(self, member):
@@ -110,83 +158,59 @@ class MemberLogs(LoggingModule):
         if not await self.base.check_logging_enabled(guild_id, 'member_leave'):
             return
 
-        logger.info(f"👋 Processing member leave: {member} from {member.guild.name}")
+        now_ts = int(time.time())
+
+        logger.info("👋 Processing member leave: %s from %s", member, member.guild.name)
 
-        # Create embed for member leave
-        embed = discord.Embed(
-            title="👋 Member Left",
-            color=discord.Color.red()
-        )
+        # Shared by the embed and the interaction log
+        role_names = [role.name for role in member.roles[1:]] if hasattr(member, 'roles') else []  # Skip @everyone
+        joined_ts = int(member.joined_at.timestamp()) if member.joined_at else None
+        time_in_server_days = (now_ts - joined_ts) // 86400 if joined_ts is not None else None
 
-        # Add member information (use string since member might be partial)
-        embed.add_field(
-            name="Member",
-            value=f"{member} (ID: {member.id})",
-            inline=True
-        )
+        # Member information (use string since member might be partial)
+        fields = [{'name': "Member", 'value': f"{member} (ID: {member.id})", 'inline': True}]
 
         # Add join date if available
-        if member.joined_at:
-            time_in_server = datetime.utcnow() - member.joined_at
-            embed.add_field(
-                name="Joined",
-                value=f"<t:{int(member.joined_at.timestamp())}:R>\n({time_in_server.days} days ago)",
-                inline=True
-            )
+        if joined_ts is not None:
+            fields.append({
+                'name': "Joined",
+                'value': f"<t:{joined_ts}:R>\n({time_in_server_days} days ago)",
+                'inline': True
+            })
         else:
-            embed.add_field(
-                name="Joined",
-                value="Unknown",
-                inline=True
-            )
-
-        # Add member count
-        embed.add_field(
-            name="Member Count",
-            value=f"#{member.guild.member_count:,}",
-            inline=True
-        )
-
-        # Add leave timestamp
-        embed.add_field(
-            name="🕒 Left At",
-            value=f"<t:{int(datetime.utcnow().timestamp())}:F>",
-            inline=True
-        )
+            fields.append({'name': "Joined", 'value': "Unknown", 'inline': True})
+
+        fields.append({'name': "Member Count", 'value': f"#{member.guild.member_count:,}", 'inline': True})
 
         # Add roles if member had any (excluding @everyone)
-        if hasattr(member, 'roles') and len(member.roles) > 1:
-            roles = [role.name for role in member.roles[1:]]  # Skip @everyone
-            if len(roles) <= 5:
-                roles_text = ", ".join(roles)
+        if role_names:
+            if len(role_names) <= 5:
+                roles_text = ", ".join(role_names)
             else:
-                roles_text = ", ".join(roles[:5]) + f" and {len(roles) - 5} more"
+                roles_text = ", ".join(role_names[:5]) + f" and {len(role_names) - 5} more"
 
-            embed.add_field(
-                name="Had Roles",
-                value=roles_text,
-                inline=False
-            )
+            fields.append({'name': "Had Roles", 'value': roles_text, 'inline': False})
 
-        # Add user ID for easy copying
-        embed.add_field(
-            name="User ID",
-            value=f"`{member.id}`",
-            inline=True
-        )
+        # Create embed for member leave with all fields at once
+        embed = discord.Embed.from_dict({
+            'title': "👋 Member Left",
+            'description': _event_description(now_ts, member.id),
+            'color': _COLOR_RED,
+            'fields': fields
+        })
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, member, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, member, config)
 
         # Send log
         await self.base.send_log(member.guild, 'member_leave', embed)
 
         # Log to interaction logger
         log_member(member, "leave", {
-            'roles': [role.name for role in member.roles[1:]] if hasattr(member, 'roles') else [],
+            'roles': role_names,
             'guild_member_count': member.guild.member_count,
-            'time_in_server_days': (datetime.utcnow() - member.joined_at).days if member.joined_at else None
+            'time_in_server_days': time_in_server_days
         })
 
     async def on_member_ban(self, guild, user):
@@ -197,58 +221,36 @@ class MemberLogs(LoggingModule):
         if not await self.base.check_logging_enabled(guild_id, 'member_ban'):
             return
 
-        logger.info(f"🔨 Processing member ban: {user} from {guild.name}")
-
-        # Create embed for member ban
-        embed = discord.Embed(
-            title="🔨 Member Banned",
-            color=discord.Color.dark_red()
-        )
+        now_ts = int(time.time())
 
-        # Add user information
-        embed.add_field(
-            name="Member",
-            value=f"{user} (ID: {user.id})",
-            inline=True
-        )
+        logger.info("🔨 Processing member ban: %s from %s", user, guild.name)
 
-        # Add ban timestamp
-        embed.add_field(
-            name="🕒 Banned At",
-            value=f"<t:{int(datetime.utcnow().timestamp())}:F>",
-            inline=True
-        )
+        fields = [
+            {'name': "Member", 'value': f"{user} (ID: {user.id})", 'inline': True},
+        ]
 
         # Try to get ban reason from audit logs
         try:
-            async for entry in guild.audit_logs(action=discord.AuditLogAction.ban, limit=10):
-                if entry.target.id == user.id:
-                    embed.add_field(
-                        name="Banned By",
-                        value=f"{entry.user.mention} ({entry.user})",
-                        inline=True
-                    )
-                    if entry.reason:
-                        embed.add_field(
-                            name="Reason",
-                            value=entry.reason,
-                            inline=False
-                        )
-                    break
+            entry = await self.find_audit_entry(guild, discord.AuditLogAction.ban, user.id)
+            if entry:
+                fields.append({'name': "Banned By", 'value': f"{entry.user.mention} ({entry.user})", 'inline': True})
+                if entry.reason:
+                    fields.append({'name': "Reason", 'value': entry.reason, 'inline': False})
         except discord.Forbidden:
             # Bot doesn't have permission to view audit logs
             pass
 
-        # Add user ID for easy copying
-        embed.add_field(
-            name="User ID",
-            value=f"`{user.id}`",
-            inline=True
-        )
+        # Create embed for member ban with all fields at once
+        embed = discord.Embed.from_dict({
+            'title': "🔨 Member Banned",
+            'description': _event_description(now_ts, user.id),
+            'color': _COLOR_DARK_RED,
+            'fields': fields
+        })
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, user, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, user, config)
 
         # Send log
         await self.base.send_log(guild, 'member_ban', embed)
@@ -257,7 +259,7 @@ class MemberLogs(LoggingModule):
         log_event("member_banned", {
             'user': f"{user} ({user.id})",
             'guild': f"{guild.name} ({guild.id})",
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.now(timezone.utc).isoformat()
         })
 
     async def on_member_unban(self, guild, user):
@@ -268,58 +270,36 @@ class MemberLogs(LoggingModule):
         if not await self.base.check_logging_enabled(guild_id, 'member_unban'):
             return
 
-        logger.info(f"🔓 Processing member unban: {user} from {guild.name}")
+        now_ts = int(time.time())
 
-        # Create embed for member unban
-        embed = discord.Embed(
-            title="🔓 Member Unbanned",
-            color=discord.Color.green()
-        )
+        logger.info("🔓 Processing member unban: %s from %s", user, guild.name)
 
-        # Add user information
-        embed.add_field(
-            name="Member",
-            value=f"{user} (ID: {user.id})",
-            inline=True
-        )
-
-        # Add unban timestamp
-        embed.add_field(
-            name="🕒 Unbanned At",
-            value=f"<t:{int(datetime.utcnow().timestamp())}:F>",
-            inline=True
-        )
+        fields = [
+            {'name': "Member", 'value': f"{user} (ID: {user.id})", 'inline': True},
+        ]
 
         # Try to get unban moderator from audit logs
         try:
-            async for entry in guild.audit_logs(action=discord.AuditLogAction.unban, limit=10):
-                if entry.target.id == user.id:
-                    embed.add_field(
-                        name="Unbanned By",
-                        value=f"{entry.user.mention} ({entry.user})",
-                        inline=True
-                    )
-                    if entry.reason:
-                        embed.add_field(
-                            name="Reason",
-                            value=entry.reason,
-                            inline=False
-                        )
-                    break
+            entry = await self.find_audit_entry(guild, discord.AuditLogAction.unban, user.id)
+            if entry:
+                fields.append({'name': "Unbanned By", 'value': f"{entry.user.mention} ({entry.user})", 'inline': True})
+                if entry.reason:
+                    fields.append({'name': "Reason", 'value': entry.reason, 'inline': False})
         except discord.Forbidden:
             # Bot doesn't have permission to view audit logs
             pass
 
-        # Add user ID for easy copying
-        embed.add_field(
-            name="User ID",
-            value=f"`{user.id}`",
-            inline=True
-        )
+        # Create embed for member unban with all fields at once
+        embed = discord.Embed.from_dict({
+            'title': "🔓 Member Unbanned",
+            'description': _event_description(now_ts, user.id),
+            'color': _COLOR_GREEN,
+            'fields': fields
+        })
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, user, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, user, config)
 
         # Send log
         await self.base.send_log(guild, 'member_unban', embed)
@@ -328,7 +308,7 @@ class MemberLogs(LoggingModule):
         log_event("member_unbanned", {
             'user': f"{user} ({user.id})",
             'guild': f"{guild.name} ({guild.id})",
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.now(timezone.utc).isoformat()
         })
 
     async def get_member_statistics(self, guild_id: str, days: int = 7):
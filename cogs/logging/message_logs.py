@@ -4,15 +4,113 @@ Handles message deletion and editing events
 """
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 import logging
-from datetime import datetime
+import re
+import time
+from functools import partial
+from typing import Optional
 
 from .base import LoggingModule
-from utils.bot_logger import log_message, log_event
+from utils.database import (
+    cached_guild_config, increment_log_counters, flush_log_counters, get_log_counter_totals
+)
+from utils.bot_logger import log_message
 
 logger = logging.getLogger(__name__)
 
+# Set to False to skip building and emitting the interaction log record for each delete/edit
+_LOG_RECORDS_ENABLED = True
+
+# Embed colors as raw values for Embed.from_dict
+_COLOR_RED = discord.Color.red().value
+_COLOR_ORANGE = discord.Color.orange().value
+
+_NO_TEXT_CONTENT = "*(No text content)*"
+
+# Last formatted "<t:...:F>" tag as (unix second, tag), shared by all events within that second
+_now_tag_cache = (0, "")
+
+
+def _now_tag() -> str:
+    """Discord full-date timestamp tag for the current second"""
+    global _now_tag_cache
+    now = int(time.time())
+    if _now_tag_cache[0] != now:
+        _now_tag_cache = (now, f"<t:{now}:F>")
+    return _now_tag_cache[1]
+
+
+# Static parts of the delete/edit embeds; the builders below fill in field values in order
+_DELETE_TMPL = {
+    'title': "🗑️ Message Deleted",
+    'color': _COLOR_RED,
+    'fields': (
+        {'name': "Author", 'inline': True},
+        {'name': "Channel", 'inline': True},
+        {'name': "Message ID", 'inline': True},
+        {'name': "Content", 'inline': False},
+        {'name': "🕒 Deleted At", 'inline': True},
+    )
+}
+
+_EDIT_TMPL = {
+    'title': "📝 Message Edited",
+    'color': _COLOR_ORANGE,
+    'fields': (
+        {'name': "Author", 'inline': True},
+        {'name': "Channel", 'inline': True},
+        {'name': "Jump to Message", 'inline': True},
+        {'name': "Before", 'inline': False},
+        {'name': "After", 'inline': False},
+        {'name': "🕒 Edited At", 'inline': True},
+        {'name': "📊 Length Change", 'inline': True},
+    )
+}
+
+
+def _build_embed(template: dict, values: tuple, avatar_url: Optional[str]) -> discord.Embed:
+    """Embed from a template with its field values filled in order"""
+    data = template.copy()
+    data['fields'] = [{**field, 'value': value} for field, value in zip(template['fields'], values)]
+    if avatar_url:
+        data['thumbnail'] = {'url': avatar_url}
+    return discord.Embed.from_dict(data)
+
+
+def _build_delete_embed(author, channel_mention: str, message_id: int, content_value: str,
+                        ts_tag: str, avatar_url: Optional[str]) -> discord.Embed:
+    """Message deleted embed"""
+    return _build_embed(_DELETE_TMPL, (
+        f"{author.mention} ({author})", channel_mention, str(message_id), content_value, ts_tag
+    ), avatar_url)
+
+
+def _build_edit_embed(author, channel_mention: str, jump_url: str, before_value: str, after_value: str,
+                      ts_tag: str, length_value: str, avatar_url: Optional[str]) -> discord.Embed:
+    """Message edited embed"""
+    return _build_embed(_EDIT_TMPL, (
+        f"{author.mention} ({author})", channel_mention, f"[Click here]({jump_url})",
+        before_value, after_value, ts_tag, length_value
+    ), avatar_url)
+
+
+# Runs of backticks that would close the ``` block around user text early
+_FENCE_RE = re.compile(r"`{3,}")
+
+
+def _code_block(text: str, max_length: int) -> str:
+    """User text in a ``` block, fence runs swapped for lookalike graves and trimmed to max_length"""
+    text = _FENCE_RE.sub("ˋˋˋ", text)
+    if len(text) > max_length:
+        return f"```{text[:max_length]}...```"
+    return f"```{text}```"
+
+
+def _preview(text: str) -> str:
+    """First 50 characters of message text for interaction log records, '' when empty"""
+    return text[:50]
+
 
 class MessageLogs(LoggingModule):
     """Handles message-related logging events"""
@@ -30,205 +128,117 @@ class MessageLogs(LoggingModule):
         """Setup method called when module is loaded"""
         logger.info("Message logging module initialized")
 
-    async def on_message_delete(self, message):
-        """Log message deletions (text only, no attachments)"""
-        # Skip bot messages
-        if message.author.bot:
-            return
+        # Write buffered delete/edit counters in the background
+        self.flush_counters.start()
 
-        # Skip if no guild (DMs, etc.)
-        if not message.guild:
-            return
+    async def teardown(self):
+        """Teardown method called when module is unloaded"""
+        # Let a flush already in progress finish rather than cancelling it mid-write
+        if self.flush_counters.is_running():
+            self.flush_counters.stop()
+
+        # Write whatever is still buffered, after any flush in progress
+        await flush_log_counters()
+
+    @tasks.loop(seconds=5)
+    async def flush_counters(self):
+        """Periodically write buffered delete/edit counters in one statement"""
+        try:
+            await flush_log_counters()
+        except Exception as e:
+            logger.error(f"Error flushing message log counters: {e}")
 
-        # Skip if message has attachments (handled by attachment_logs)
-        if message.attachments:
+    async def on_message_delete(self, message):
+        """Log message deletions (text only, no attachments)"""
+        # Skip bot messages, DMs and messages with attachments (handled by attachment_logs)
+        author = message.author
+        if author.bot or not message.guild or message.attachments:
             return
 
-        guild_id = str(message.guild.id)
+        guild = message.guild
+        channel = message.channel
+        guild_id = str(guild.id)
 
         # Check if logging is enabled for this event
         if not await self.base.check_logging_enabled(guild_id, 'message_delete'):
             return
 
-        logger.info(f"🗑️ Processing text message deletion in {message.guild.name}")
-
-        # Create embed for deleted message
-        embed = discord.Embed(
-            title="🗑️ Message Deleted",
-            color=discord.Color.red()
-        )
+        logger.info("🗑️ Processing text message deletion in %s", guild.name)
 
-        # Add user information
-        self.base.add_user_info(embed, message.author, "Author")
+        content = message.content
+        message_id = message.id
 
-        # Add channel information
-        embed.add_field(
-            name="Channel",
-            value=message.channel.mention,
-            inline=True
-        )
-
-        # Add message ID
-        embed.add_field(
-            name="Message ID",
-            value=str(message.id),
-            inline=True
-        )
+        # Add avatar if enabled
+        config = await cached_guild_config(guild_id)
 
-        # Add message content if any
-        if message.content:
-            content = self.base.format_content(message.content, 1000)
-            embed.add_field(
-                name="Content",
-                value=f"```{content}```",
-                inline=False
-            )
-        else:
-            embed.add_field(
-                name="Content",
-                value="*(No text content)*",
-                inline=False
-            )
-
-        # Add deletion timestamp
-        embed.add_field(
-            name="🕒 Deleted At",
-            value=f"<t:{int(datetime.utcnow().timestamp())}:F>",
-            inline=True
+        embed = _build_delete_embed(
+            author, channel.mention, message_id,
+            _code_block(content, 1000) if content else _NO_TEXT_CONTENT,
+            _now_tag(), self.base.guild_avatar_url(author, config)
         )
 
-        # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, message.author, guild_id)
-        await add_avatar()
-
-        # Send log
-        await self.base.send_log(message.guild, 'message_delete', embed)
+        # Send log; it is counted once Discord accepts it
+        await self.base.send_log(guild, 'message_delete', embed,
+                                 on_sent=partial(increment_log_counters, guild_id, deletes=1))
 
         # Log to interaction logger
-        log_message(message, "deleted", f"Content: {message.content[:50]}..." if message.content else "No content")
+        if _LOG_RECORDS_ENABLED:
+            log_message(message, "deleted", f"Content: {_preview(content)}" if content else "No content")
 
     async def on_message_edit(self, before, after):
         """Log message edits"""
-        # Skip bot messages
-        if before.author.bot:
-            return
-
-        # Skip if no guild (DMs, interaction responses, etc.)
-        if not before.guild:
-            return
-
-        # Skip if content didn't actually change
-        if before.content == after.content:
+        # Skip unchanged content (embed unfurls, pins), bot messages and DMs
+        before_text = before.content
+        after_text = after.content
+        author = before.author
+        if before_text == after_text or author.bot or not before.guild:
             return
 
-        guild_id = str(before.guild.id)
+        guild = before.guild
+        channel = before.channel
+        guild_id = str(guild.id)
 
         # Check if logging is enabled for this event
         if not await self.base.check_logging_enabled(guild_id, 'message_edit'):
             return
 
-        logger.info(f"📝 Processing message edit in {before.guild.name}")
-
-        # Create embed for edited message
-        embed = discord.Embed(
-            title="📝 Message Edited",
-            color=discord.Color.orange()
-        )
-
-        # Add user information
-        self.base.add_user_info(embed, before.author, "Author")
-
-        # Add channel information
-        embed.add_field(
-            name="Channel",
-            value=before.channel.mention,
-            inline=True
-        )
-
-        # Add jump link
-        self.base.create_jump_link_field(embed, after)
-
-        # Before content
-        if before.content:
-            before_content = self.base.format_content(before.content, 500)
-            embed.add_field(
-                name="Before",
-                value=f"```{before_content}```",
-                inline=False
-            )
-        else:
-            embed.add_field(
-                name="Before",
-                value="*(No text content)*",
-                inline=False
-            )
-
-        # After content
-        if after.content:
-            after_content = self.base.format_content(after.content, 500)
-            embed.add_field(
-                name="After",
-                value=f"```{after_content}```",
-                inline=False
-            )
-        else:
-            embed.add_field(
-                name="After",
-                value="*(No text content)*",
-                inline=False
-            )
-
-        # Add edit timestamp
-        embed.add_field(
-            name="🕒 Edited At",
-            value=f"<t:{int(datetime.utcnow().timestamp())}:F>",
-            inline=True
-        )
+        logger.info("📝 Processing message edit in %s", guild.name)
 
         # Show character count change
-        before_len = len(before.content) if before.content else 0
-        after_len = len(after.content) if after.content else 0
+        before_len = len(before_text) if before_text else 0
+        after_len = len(after_text) if after_text else 0
         length_change = after_len - before_len
 
-        if length_change != 0:
-            change_text = f"+{length_change}" if length_change > 0 else str(length_change)
-            embed.add_field(
-                name="📊 Length Change",
-                value=f"{before_len} → {after_len} ({change_text} chars)",
-                inline=True
-            )
-
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, before.author, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+
+        embed = _build_edit_embed(
+            author, channel.mention, after.jump_url,
+            _code_block(before_text, 500) if before_text else _NO_TEXT_CONTENT,
+            _code_block(after_text, 500) if after_text else _NO_TEXT_CONTENT,
+            _now_tag(), f"{before_len} → {after_len} ({length_change:+d} chars)",
+            self.base.guild_avatar_url(author, config)
+        )
 
-        # Send log
-        await self.base.send_log(before.guild, 'message_edit', embed)
+        # Send log; it is counted once Discord accepts it
+        await self.base.send_log(guild, 'message_edit', embed,
+                                 on_sent=partial(increment_log_counters, guild_id, edits=1))
 
-        # Log to interaction logger
-        log_message(before, "edited", f"Before: {before.content[:50]}... | After: {after.content[:50]}...")
-
-        # Log edit event details
-        log_event("message_edited", {
-            'guild_id': str(before.guild.id),
-            'channel_id': str(before.channel.id),
-            'message_id': str(before.id),
-            'author_id': str(before.author.id),
-            'before_length': before_len,
-            'after_length': after_len,
-            'length_change': length_change
-        })
+        # Log to interaction logger, with the length change in the same record
+        if _LOG_RECORDS_ENABLED:
+            log_message(before, "edited",
+                        f"Before: {_preview(before_text)} | After: {_preview(after_text)} | "
+                        f"Length: {before_len} → {after_len} ({length_change:+d})")
 
     async def get_message_statistics(self, guild_id: str, days: int = 7):
         """Get message deletion/edit statistics for a guild"""
-        # This method can be expanded when we add analytics in future weeks
+        # Summed from the daily guild_log_counters rows, counting only logs actually delivered
+        totals = await get_log_counter_totals(guild_id, days)
+
         stats = {
-            'deletes_tracked': 0,
-            'edits_tracked': 0,
+            'deletes_tracked': totals['deletes'],
+            'edits_tracked': totals['edits'],
             'period_days': days
         }
 
-        # TODO: Query database for actual statistics
-        # This will be implemented when we add the analytics features
-
-        return stats
\ No newline at end of file
+        return stats
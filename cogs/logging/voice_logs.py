@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, Any
 
 from .base import LoggingModule
+from utils.database import cached_guild_config
 from utils.bot_logger import log_event, log_member
 
 logger = logging.getLogger(__name__)
@@ -234,8 +235,8 @@ class VoiceLogs(LoggingModule):
         )
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, member, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, member, config)
 
         await self.base.send_log(member.guild, 'voice_join', embed)
 
@@ -298,8 +299,8 @@ class VoiceLogs(LoggingModule):
         )
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, member, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, member, config)
 
         await self.base.send_log(member.guild, 'voice_leave', embed)
 
@@ -368,8 +369,8 @@ class VoiceLogs(LoggingModule):
         )
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, member, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, member, config)
 
         await self.base.send_log(member.guild, 'voice_move', embed)
 
@@ -424,8 +425,8 @@ class VoiceLogs(LoggingModule):
         )
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, member, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, member, config)
 
         await self.base.send_log(member.guild, 'voice_mute', embed)
 
@@ -479,8 +480,8 @@ class VoiceLogs(LoggingModule):
         )
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, member, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, member, config)
 
         await self.base.send_log(member.guild, 'voice_deafen', embed)
 
@@ -533,8 +534,8 @@ class VoiceLogs(LoggingModule):
         )
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, member, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, member, config)
 
         await self.base.send_log(member.guild, 'voice_stream', embed)
 
@@ -586,8 +587,8 @@ class VoiceLogs(LoggingModule):
         )
 
         # Add avatar if enabled
-        add_avatar = self.base.add_guild_avatar(embed, member, guild_id)
-        await add_avatar()
+        config = await cached_guild_config(guild_id)
+        self.base.apply_guild_avatar(embed, member, config)
 
         await self.base.send_log(member.guild, 'voice_video', embed)
 
@@ -647,7 +648,7 @@ class VoiceLogs(LoggingModule):
 
     async def end_all_sessions(self, reason="Bot shutdown"):
         """End all active voice sessions"""
-        for user_id in list(self.active_sessions.keys()):
+        for user_id in list(self.active_sessions):
             await self.end_session(user_id, reason)
 
     def get_channel_type(self, channel):
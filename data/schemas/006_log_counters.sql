@@ -0,0 +1,15 @@
+-- Log Counters Schema
+-- File: data/schemas/006_log_counters.sql
+-- Description: Per-guild daily counters for logged message events
+
+-- Guild Log Counters Table
+-- Incremented as events are logged, so statistics are a SUM over a few daily rows
+-- The (guild_id, day) primary key doubles as the index for per-guild date range reads
+CREATE TABLE IF NOT EXISTS guild_log_counters (
+    guild_id TEXT NOT NULL,
+    day DATE NOT NULL,
+    deletes INTEGER NOT NULL DEFAULT 0,
+    edits INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (guild_id, day)
+);
@@ -202,7 +202,8 @@ class BotInteractionLogger:
 
             self.safe_log(self.interaction_logger, 'debug', f"📡 DISCORD EVENT: {event_name}")
 
-            if event_data:
+            # Only serialize the payload when it will actually be written
+            if event_data and self.interaction_logger.isEnabledFor(logging.DEBUG):
                 try:
                     data_json = json.dumps(event_data, default=str, indent=2)
                     self.safe_log(self.interaction_logger, 'debug', f"   📋 Data: {data_json}")
@@ -459,7 +459,7 @@ class ChannelManager:
 
     def get_available_events(self) -> List[str]:
         """Get list of all available event types"""
-        return list(self.event_definitions.keys())
+        return list(self.event_definitions)
 
     def get_event_info(self, event_type: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific event type"""
@@ -480,7 +480,7 @@ class ChannelManager:
             'unmapped_events': []
         }
 
-        available_events = set(self.event_definitions.keys())
+        available_events = set(self.event_definitions)
         mapped_events = set()
 
         for channel_name, events in custom_mapping.items():
@@ -7,8 +7,10 @@ import aiosqlite
 import logging
 import os
 import asyncio
+import time
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable, Awaitable, FrozenSet
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -99,6 +101,12 @@ ON guild_configs(logging_enabled) WHERE logging_enabled = 1;"""
                 except Exception as e:
                     logger.error(f"Error creating sample schema {filename}: {e}")
 
+# Writable guild_configs columns, also the whitelist for partial updates
+GUILD_CONFIG_COLUMNS = (
+    'guild_name', 'logging_enabled', 'log_channel_id', 'log_format',
+    'show_avatars', 'show_timestamps', 'embed_color'
+)
+
 class DatabaseManager:
     """Enhanced database manager with flexible event channel support"""
 
@@ -285,6 +293,23 @@ class DatabaseManager:
             await db.commit()
             logger.info(f"Updated config for guild {guild_id}")
 
+    async def update_guild_config_fields(self, guild_id: str, updates: Dict[str, Any]):
+        """Write only the given guild config columns, creating the row if needed"""
+        columns = [column for column in GUILD_CONFIG_COLUMNS if column in updates]
+        if not columns:
+            return
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute(f'''
+                INSERT INTO guild_configs (guild_id, {", ".join(columns)}, updated_at)
+                VALUES (?, {", ".join("?" for _ in columns)}, CURRENT_TIMESTAMP)
+                ON CONFLICT(guild_id) DO UPDATE SET
+                {", ".join(f"{column} = excluded.{column}" for column in columns)},
+                updated_at = CURRENT_TIMESTAMP
+            ''', (guild_id, *(updates[column] for column in columns)))
+            await db.commit()
+            logger.info(f"Updated config fields {columns} for guild {guild_id}")
+
     async def get_log_events(self, guild_id: str) -> List[Dict[str, Any]]:
         """Get enabled log events for a guild"""
         async with aiosqlite.connect(self.db_path) as db:
@@ -306,6 +331,16 @@ class DatabaseManager:
             await db.commit()
             logger.info(f"Set {event_type} = {enabled} for guild {guild_id}")
 
+    async def set_log_events(self, guild_id: str, event_types: List[str], enabled: bool):
+        """Enable or disable several log events for a guild in one statement"""
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany('''
+                INSERT OR REPLACE INTO log_events (guild_id, event_type, enabled)
+                VALUES (?, ?, ?)
+            ''', [(guild_id, event_type, enabled) for event_type in event_types])
+            await db.commit()
+            logger.info(f"Set {len(event_types)} events = {enabled} for guild {guild_id}")
+
     async def get_all_enabled_events(self, guild_id: str) -> List[str]:
         """Get list of enabled event types for a guild"""
         async with aiosqlite.connect(self.db_path) as db:
@@ -316,6 +351,21 @@ class DatabaseManager:
                 rows = await cursor.fetchall()
                 return [row[0] for row in rows]
 
+    async def get_logging_state(self, guild_id: str) -> Tuple[bool, FrozenSet[str]]:
+        """Get the guild logging switch and its enabled event types in one query"""
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute('''
+                SELECT gc.logging_enabled, le.event_type
+                FROM guild_configs gc
+                LEFT JOIN log_events le ON le.guild_id = gc.guild_id AND le.enabled = 1
+                WHERE gc.guild_id = ?
+            ''', (guild_id,)) as cursor:
+                rows = await cursor.fetchall()
+
+        if not rows:
+            return False, frozenset()
+        return bool(rows[0][0]), frozenset(row[1] for row in rows if row[1] is not None)
+
     # ==================== NEW: FLEXIBLE EVENT CHANNEL METHODS ====================
 
     async def set_event_channel(self, guild_id: str, event_type: str, channel_id: str, channel_name: str = None):
@@ -395,6 +445,7 @@ class DatabaseManager:
                     summary['total_events_mapped'] += len(events)
                     summary['channels'].append({
                         'channel_id': row['channel_id'],
+                        'channel_id_int': int(row['channel_id']),
                         'channel_name': row['channel_name'],
                         'events': events,
                         'event_count': len(events)
@@ -402,6 +453,16 @@ class DatabaseManager:
 
                 return summary
 
+    async def count_event_channels(self, guild_id: str) -> int:
+        """Count event channel mappings for a guild"""
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                "SELECT COUNT(*) FROM log_event_channels WHERE guild_id = ?",
+                (guild_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+                return row[0] if row else 0
+
     async def remove_event_channel(self, guild_id: str, event_type: str):
         """Remove channel mapping for an event type"""
         async with aiosqlite.connect(self.db_path) as db:
@@ -458,9 +519,88 @@ class DatabaseManager:
         logger.info(f"Migrated {len(enabled_events)} events to event channels for guild {guild_id}")
         return len(enabled_events)
 
+    # ==================== LOG COUNTERS ====================
+
+    async def add_log_counters(self, rows: List[Tuple[str, str, int, int]]):
+        """Add (guild_id, day, deletes, edits) increments to the daily counters in one statement"""
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany('''
+                INSERT INTO guild_log_counters (guild_id, day, deletes, edits)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(guild_id, day) DO UPDATE SET
+                deletes = deletes + excluded.deletes,
+                edits = edits + excluded.edits
+            ''', rows)
+            await db.commit()
+
+    async def get_log_counter_totals(self, guild_id: str, days: int) -> Dict[str, int]:
+        """Sum a guild's message delete/edit counters over the last few days"""
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute('''
+                SELECT COALESCE(SUM(deletes), 0), COALESCE(SUM(edits), 0)
+                FROM guild_log_counters
+                WHERE guild_id = ? AND day > date('now', ?)
+            ''', (guild_id, f"-{int(days)} days")) as cursor:
+                row = await cursor.fetchone()
+                return {'deletes': row[0], 'edits': row[1]}
+
+class GuildCache:
+    """Short-lived per-guild cache for read-mostly lookups
+
+    Concurrent misses for the same guild share one load, and an invalidation
+    that happens while a load is running keeps that result out of the cache.
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, ttl: float = 30):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def get(self, guild_id: str, loader: Callable[[str], Awaitable[Any]]) -> Any:
+        """Return the cached value for a guild, loading it on a miss"""
+        entry = self._entries.get(guild_id)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+
+        task = self._inflight.get(guild_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load(guild_id, loader))
+            self._inflight[guild_id] = task
+        return await asyncio.shield(task)
+
+    async def _load(self, guild_id: str, loader: Callable[[str], Awaitable[Any]]) -> Any:
+        task = asyncio.current_task()
+        try:
+            value = await loader(guild_id)
+            if value is not None and self._inflight.get(guild_id) is task:
+                self._entries[guild_id] = (time.monotonic(), value)
+            return value
+        finally:
+            if self._inflight.get(guild_id) is task:
+                del self._inflight[guild_id]
+
+    def invalidate(self, guild_id: str):
+        """Drop the cached value for a guild"""
+        self._entries.pop(guild_id, None)
+        self._inflight.pop(guild_id, None)
+
 # Global database manager instance
 db_manager: Optional[DatabaseManager] = None
 
+# Read caches, invalidated by the write helpers below
+_config_cache = GuildCache()
+_event_channels_cache = GuildCache()
+_summary_cache = GuildCache()
+_logging_state_cache = GuildCache()
+
+# Counter increments waiting to be written, keyed by (guild_id, UTC day, 'deletes' or 'edits')
+_pending_counters: Counter = Counter()
+_COUNTER_FLUSH_THRESHOLD = 200
+
+# One flush writes at a time, so a final flush waits for one already in progress
+_counter_flush_lock = asyncio.Lock()
+
 async def init_database(db_path: str):
     """Initialize the global database manager with schema files"""
     global db_manager
@@ -486,15 +626,68 @@ async def is_event_enabled(guild_id: str, event_type: str) -> bool:
         return any(event['event_type'] == event_type for event in events)
     return False
 
-async def update_guild_config(guild_id: str, config: Dict[str, Any]):
-    """Update guild configuration"""
+def _normalize_config(config: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Parse stored channel IDs and embed color once, before the config is cached"""
+    if config:
+        if config.get('log_channel_id'):
+            config['log_channel_id'] = int(config['log_channel_id'])
+
+        # Parsed '#rrggbb' embed color as an int, None if unset or malformed
+        config['embed_color_value'] = None
+        if config.get('embed_color'):
+            try:
+                config['embed_color_value'] = int(config['embed_color'].replace('#', ''), 16)
+            except ValueError:
+                logger.debug(f"Ignoring invalid embed color {config['embed_color']!r}")
+    return config
+
+async def _load_logging_state(guild_id: str) -> Tuple[bool, FrozenSet[str]]:
+    if db_manager:
+        return await db_manager.get_logging_state(guild_id)
+    return False, frozenset()
+
+async def is_logging_and_event_enabled(guild_id: str, event_type: str) -> Tuple[bool, bool]:
+    """Check the guild logging switch and one event type together, served from cache while fresh"""
+    logging_enabled, enabled_events = await _logging_state_cache.get(str(guild_id), _load_logging_state)
+    return logging_enabled, event_type in enabled_events
+
+async def _load_guild_config(guild_id: str) -> Optional[Dict[str, Any]]:
+    return _normalize_config(await get_guild_config(guild_id))
+
+async def cached_guild_config(guild_id: str) -> Optional[Dict[str, Any]]:
+    """Get guild configuration, served from cache while fresh
+
+    log_channel_id is an int and embed_color_value holds the parsed embed color.
+    """
+    return await _config_cache.get(str(guild_id), _load_guild_config)
+
+async def update_guild_config(guild_id: str, config: Dict[str, Any], partial: bool = False):
+    """Update guild configuration (partial=True writes only the keys in config)"""
     if db_manager:
-        await db_manager.create_or_update_guild_config(str(guild_id), config)
+        if partial:
+            await db_manager.update_guild_config_fields(str(guild_id), config)
+        else:
+            await db_manager.create_or_update_guild_config(str(guild_id), config)
+        _config_cache.invalidate(str(guild_id))
+        _logging_state_cache.invalidate(str(guild_id))
 
 async def set_event_enabled(guild_id: str, event_type: str, enabled: bool):
     """Enable or disable an event type"""
     if db_manager:
         await db_manager.set_log_event(str(guild_id), event_type, enabled)
+        _logging_state_cache.invalidate(str(guild_id))
+
+async def get_all_enabled_events(guild_id: str) -> List[str]:
+    """Get enabled event types for a guild"""
+    if db_manager:
+        return await db_manager.get_all_enabled_events(str(guild_id))
+    return []
+
+async def set_events_enabled(guild_id: str, event_types: List[str], enabled: bool):
+    """Enable or disable multiple event types at once"""
+    if db_manager:
+        await db_manager.set_log_events(str(guild_id), event_types, enabled)
+        _logging_state_cache.invalidate(str(guild_id))
 
 # New schema management functions
 async def get_schema_status() -> Dict[str, Any]:
@@ -514,11 +707,13 @@ async def set_event_channel(guild_id: str, event_type: str, channel_id: str, cha
     """Map an event type to a specific channel"""
     if db_manager:
         await db_manager.set_event_channel(str(guild_id), event_type, str(channel_id), channel_name)
+        invalidate_channel_mappings(guild_id)
 
 async def set_events_channel(guild_id: str, event_types: List[str], channel_id: str, channel_name: str = None):
     """Map multiple event types to a single channel"""
     if db_manager:
         await db_manager.set_events_channel(str(guild_id), event_types, str(channel_id), channel_name)
+        invalidate_channel_mappings(guild_id)
 
 async def get_event_channel(guild_id: str, event_type: str) -> Optional[str]:
     """Get the channel ID for a specific event type"""
@@ -544,13 +739,82 @@ async def get_channel_mapping_summary(guild_id: str) -> Dict[str, Any]:
         return await db_manager.get_channel_mapping_summary(str(guild_id))
     return {}
 
+async def count_event_channels(guild_id: str) -> int:
+    """Count event channel mappings"""
+    if db_manager:
+        return await db_manager.count_event_channels(str(guild_id))
+    return 0
+
+async def cached_event_channels(guild_id: str) -> Dict[str, str]:
+    """Get all event-to-channel mappings, served from cache while fresh"""
+    return await _event_channels_cache.get(str(guild_id), get_all_event_channels)
+
+async def cached_event_channel(guild_id: str, event_type: str) -> Optional[str]:
+    """Get the channel ID for an event type from the cached mappings"""
+    return (await cached_event_channels(guild_id)).get(event_type)
+
+async def cached_mapping_summary(guild_id: str) -> Dict[str, Any]:
+    """Get channel mapping summary, served from cache while fresh"""
+    return await _summary_cache.get(str(guild_id), get_channel_mapping_summary)
+
+def invalidate_channel_mappings(guild_id: str):
+    """Drop cached channel mappings for a guild"""
+    guild_id = str(guild_id)
+    _event_channels_cache.invalidate(guild_id)
+    _summary_cache.invalidate(guild_id)
+
 async def remove_event_channel(guild_id: str, event_type: str):
     """Remove channel mapping for an event"""
     if db_manager:
         await db_manager.remove_event_channel(str(guild_id), event_type)
+        invalidate_channel_mappings(guild_id)
+
+async def increment_log_counters(guild_id: str, deletes: int = 0, edits: int = 0):
+    """Count logged message deletes/edits for a guild, buffered until flush_log_counters"""
+    day = time.strftime('%Y-%m-%d', time.gmtime())
+    guild_id = str(guild_id)
+    if deletes:
+        _pending_counters[(guild_id, day, 'deletes')] += deletes
+    if edits:
+        _pending_counters[(guild_id, day, 'edits')] += edits
+
+    if len(_pending_counters) >= _COUNTER_FLUSH_THRESHOLD:
+        await flush_log_counters()
+
+async def flush_log_counters():
+    """Write all buffered counter increments, keeping them buffered if the write fails"""
+    async with _counter_flush_lock:
+        if not _pending_counters or not db_manager:
+            return
+
+        # Increments arriving during the write start a new buffer
+        pending = _pending_counters.copy()
+        _pending_counters.clear()
+
+        rows: Dict[Tuple[str, str], List[int]] = {}
+        for (guild_id, day, column), count in pending.items():
+            rows.setdefault((guild_id, day), [0, 0])[column == 'edits'] += count
+
+        try:
+            await db_manager.add_log_counters([
+                (guild_id, day, deletes, edits) for (guild_id, day), (deletes, edits) in rows.items()
+            ])
+        except BaseException:
+            # Failed or cancelled: put the counts back for the next flush
+            _pending_counters.update(pending)
+            raise
+
+async def get_log_counter_totals(guild_id: str, days: int = 7) -> Dict[str, int]:
+    """Get a guild's logged message delete/edit totals over the last few days"""
+    if db_manager:
+        await flush_log_counters()
+        return await db_manager.get_log_counter_totals(str(guild_id), days)
+    return {'deletes': 0, 'edits': 0}
 
 async def clear_all_event_channels(guild_id: str):
     """Clear all event channel mappings"""
     if db_manager:
-        return await db_manager.clear_all_event_channels(str(guild_id))
+        removed_count = await db_manager.clear_all_event_channels(str(guild_id))
+        invalidate_channel_mappings(guild_id)
+        return removed_count
     return 0
\ No newline at end of file
@@ -4,7 +4,7 @@ Common embed templates and utilities
 """
 
 import discord
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterable, Tuple
 
 class EmbedBuilder:
     """Utility class for building Discord embeds"""
@@ -39,6 +39,14 @@ class EmbedBuilder:
         )
         return embed
     
+    @staticmethod
+    def add_fields(embed: discord.Embed, fields: Iterable[Tuple[str, str, bool]]) -> discord.Embed:
+        """Add prebuilt (name, value, inline) fields to an embed in order"""
+        add_field = embed.add_field
+        for name, value, inline in fields:
+            add_field(name=name, value=value, inline=inline)
+        return embed
+    
     @staticmethod
     def info(title: str, description: str = None, color: discord.Color = discord.Color.blue()) -> discord.Embed:
         """Create an info embed"""
@@ -30,6 +30,11 @@ class AttachmentLogger:
             'code': {'.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.php', '.rb', '.go'}
         }
 
+        # Extension tuples so str.endswith checks a whole category in one call
+        self._extension_tuples = [
+            (category, tuple(extensions)) for category, extensions in self.file_types.items()
+        ]
+
     def setup_attachment_logger(self):
         """Setup specialized logger for attachments"""
         self.attachment_logger = logging.getLogger('Fenrir.attachments')
@@ -48,8 +53,8 @@ class AttachmentLogger:
     def categorize_file(self, filename: str) -> str:
         """Categorize file by extension"""
         filename_lower = filename.lower()
-        for category, extensions in self.file_types.items():
-            if any(filename_lower.endswith(ext) for ext in extensions):
+        for category, extensions in self._extension_tuples:
+            if filename_lower.endswith(extensions):
                 return category
         return 'other'
 